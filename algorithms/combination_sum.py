@@ -3,6 +3,11 @@
 """
 Taken from Leetcode 39
 """
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data_structures"))
+from stack import PersistentStack
 
 def combination_sum(candidates: list[int], target: int) -> list[list[int]]:
     """
@@ -23,13 +28,15 @@ def combination_sum(candidates: list[int], target: int) -> list[list[int]]:
     # Space: O(t/m)
         # Implement with recursion that can add up to t/m
         # Also keep a combination of numbers of at most length t/m
+        # The combination is a PersistentStack, so each level pushes one cell
+        # onto its parent's version instead of copying or undoing anything
 
     results: list[list[int]] = []
 
-    def backtrack(remaining: int, current_combination: list[int], candidate_idx: int) -> None:
+    def backtrack(remaining: int, current_combination: PersistentStack, candidate_idx: int) -> None:
         # We have found a valid combination
         if remaining == 0:
-            results.append(list(current_combination))
+            results.append(current_combination.to_list())
             return
 
         # Unable to proceed further
@@ -37,13 +44,11 @@ def combination_sum(candidates: list[int], target: int) -> list[list[int]]:
             return
 
         for i in range(candidate_idx, len(candidates)):
-            current_combination.append(candidates[i])
-            backtrack(remaining - candidates[i], current_combination, i)
-            current_combination.pop()
+            backtrack(remaining - candidates[i], current_combination.push(candidates[i]), i)
 
         return
 
-    backtrack(target, [], 0)
+    backtrack(target, PersistentStack(), 0)
     return results
 
 
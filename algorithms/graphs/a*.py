@@ -6,10 +6,21 @@ It works by branching from the start to the end and considers it's next node to
 In this example, the heuristic we used is the Manhattan Distance.
 This algorithm works better than Dijkstras because of the bias the heuristic introduces, making it always search towards the end.
 
-O(w * h * log(w * h)) time
+Every step costs 1 and the Manhattan Distance changes by exactly 1 per step, so a neighbor's FScore is
+either the same as or 2 more than the FScore of the node it was reached from. The FScores popped never
+go down, so the nodes to visit are kept in a BucketQueue with max_step 2 instead of a heap.
+A BucketQueue cannot lower a priority, so an improved node is added again and the stale entry is skipped.
+
+O(w * h) time
 O(w * h) space
 """
 
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data_structures"))
+from bucket_queue import BucketQueue
+
 class Node:
     def __init__(self, row: int, col: int, value: int):
         self.id = str(row) + '-' + str(col)
@@ -28,9 +39,14 @@ def sStar(startRow, startCol, endRow, endCol, graph):
     startNode.GScore = 0
     startNode.FScore = getHeuristic(startNode, endNode)
 
-    nodesToVisit = minHeap([startNode])
-    while len(nodesToVisit.items) > 0:
-        currentMinDistanceNode = nodesToVisit.poll()
+    nodesToVisit = BucketQueue(2, startNode.FScore)
+    nodesToVisit.add(startNode, startNode.FScore)
+    visited = set()
+    while len(nodesToVisit) > 0:
+        currentMinDistanceNode = nodesToVisit.pop()
+        if currentMinDistanceNode.id in visited:   # A stale entry from before the node improved
+            continue
+        visited.add(currentMinDistanceNode.id)
 
         if currentMinDistanceNode == endNode:
             break
@@ -46,11 +62,7 @@ def sStar(startRow, startCol, endRow, endCol, graph):
             neighbor.previous = currentMinDistanceNode
             neighbor.GScore = tentativeDistanceToNeighbor
             neighbor.FScore = tentativeDistanceToNeighbor + getHeuristic(neighbor, endNode)
-
-            if not nodesToVisit.contains(neighbor):
-                nodesToVisit.add(neighbor)
-            else:
-                nodesToVisit.update(neighbor)
+            nodesToVisit.add(neighbor, neighbor.FScore)
 
     return reconstructPath(endNode)
 
@@ -102,4 +114,17 @@ def initializeNodes(graph: list[list[int]]):
         for j, value in enumerate(row):
             nodes[i].append(Node(i, j, value))
 
-    return nodes
\ No newline at end of file
+    return nodes
+
+
+if __name__ == "__main__":
+    # 0 is an open cell and 1 is an obstacle
+    grid = [
+        [0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 0],
+        [0, 0, 0, 1, 0],
+        [1, 0, 1, 1, 0],
+        [0, 0, 0, 0, 0]
+    ]
+
+    print(sStar(0, 1, 4, 3, grid))
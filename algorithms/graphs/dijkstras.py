@@ -3,7 +3,12 @@ An implementation of Dijkstra's Algorithm to find the Single-Source Shortest Pat
 graph with non-negative weights
 """
 
-from collections import deque
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data_structures"))
+from heap import IndexedMinHeap # pylint: disable=wrong-import-position,import-error
+from bucket_queue import BucketQueue # pylint: disable=wrong-import-position,import-error
 
 
 def dijkstras(start: int, edges: dict[int, list[tuple[int, int]]]) -> dict[int, list[int]]:
@@ -13,10 +18,10 @@ def dijkstras(start: int, edges: dict[int, list[tuple[int, int]]]) -> dict[int,
     I only wrote this to work on undirected graphs
     Return a mapping of the vertex and its path to get to the start vertex
 
-    Time: O(V^2) or O(E)
-        If the graph is complete, then would need to visit every edge between all vertices
+    Time: O((V + E) * log V)
+        Every vertex is popped from the heap once and every edge can cause a decrease_key
     Space: O(V)
-        Need to store a table of length V
+        Need to store a table of length V and the heap holds each vertex at most once
     """
     # Maintain a table that keeps track of distances to the start and through what vertex it
     # can reach the start
@@ -24,19 +29,63 @@ def dijkstras(start: int, edges: dict[int, list[tuple[int, int]]]) -> dict[int,
     table[start] = (0, None)
 
     visited_vertices: set[int] = set()
-    queue: deque = deque([start])
+    # The frontier is an indexed heap so that a vertex whose distance improves has its
+    # priority lowered in place rather than being pushed again
+    frontier: IndexedMinHeap = IndexedMinHeap()
+    frontier.add(start, 0)
 
-    while queue:
-        current_vertex: int = queue.popleft()
+    while frontier:
+        current_vertex: int = frontier.pop()
         current_cost: int = table[current_vertex][0]
+        visited_vertices.add(current_vertex)
+
         for dst, cost in edges[current_vertex]:
+            if dst in visited_vertices:
+                continue
+
             if current_cost + cost < table[dst][0]:
                 table[dst] = (current_cost + cost, current_vertex)
+                if dst in frontier:
+                    frontier.decrease_key(dst, current_cost + cost)
+                else:
+                    frontier.add(dst, current_cost + cost)
+
+    return create_paths(start, table)
+
+
+def dials(start: int, edges: dict[int, list[tuple[int, int]]]) -> dict[int, list[int]]:
+    """
+    Dial's algorithm is Dijkstra's algorithm for graphs with small non-negative integer weights
+    The frontier is a BucketQueue with one bucket per distance instead of a heap, so
+    pushing and popping a vertex does no comparisons.
+    A BucketQueue cannot lower a priority, so an improved vertex is added again and
+    the stale entry is skipped when it is popped
+
+    Time: O(E + V * C)
+        C is the largest edge weight, the queue's cursor moves over at most V * C distances
+    Space: O(E + C)
+        The queue can hold an entry per edge plus C + 1 buckets
+    """
+    table: dict[int, tuple[int, int]] = {i: (float("inf"), None) for i in edges.keys()}
+    table[start] = (0, None)
+
+    max_cost: int = max((cost for neighbors in edges.values() for _, cost in neighbors), default=0)
+    frontier: BucketQueue = BucketQueue(max_cost)
+    frontier.add(start, 0)
+    visited_vertices: set[int] = set()
 
-            if dst not in visited_vertices:
-                queue.append(dst)
+    while frontier:
+        current_vertex: int = frontier.pop()
+        if current_vertex in visited_vertices:
+            continue
+        current_cost: int = table[current_vertex][0]
         visited_vertices.add(current_vertex)
 
+        for dst, cost in edges[current_vertex]:
+            if current_cost + cost < table[dst][0]:
+                table[dst] = (current_cost + cost, current_vertex)
+                frontier.add(dst, current_cost + cost)
+
     return create_paths(start, table)
 
 
@@ -73,3 +122,4 @@ if __name__ == "__main__":
 
     print(dijkstras(0, graph_edges))
     print(dijkstras(2, graph_edges))
+    print(dials(0, graph_edges))
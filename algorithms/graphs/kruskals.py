@@ -2,9 +2,13 @@
 An implementation of Kruskal's Algorithm to create Minimum Spanning Trees
 """
 
-import heapq
+import os
+import sys
 from disjoint_set import UnionFind
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data_structures"))
+from heap import MinPriorityHeap # pylint: disable=wrong-import-position,import-error
+
 class Edge:
     """
     Represents an edge in a weighted undirected graph
@@ -17,9 +21,6 @@ class Edge:
         self.dst = dst
         self.cost = cost
 
-    def __lt__(self, other: 'Edge') -> bool:
-        return self.cost < other.cost
-
     def __hash__(self) -> int:
         return hash((self.src, self.dst)) + hash((self.dst, self.src))
 
@@ -34,7 +35,8 @@ def kruskals(edges: dict[int, list[tuple[int, int]]]) -> list[Edge]:
     Constructs a minimum spanning tree given the edges of a graph
 
     1. Sort all edges by their weights in ascending order
-        - Sorting is done via a MinHeap
+        - Sorting is done via a MinHeap keyed on the edge cost, so the heap compares
+          numbers rather than calling a method on each Edge
     2. Add edges in that order into the MST. Skip the edges that would create a cycle in the MST
         - Cycle checking is done via UnionFind
     3. Repeat step 2 until V-1 edges are added
@@ -59,9 +61,8 @@ def kruskals(edges: dict[int, list[tuple[int, int]]]) -> list[Edge]:
             if edge not in edge_set:
                 edge_set.add(edge)
 
-    # Create a min_heap from the edge_set
-    min_heap: list = list(edge_set)
-    heapq.heapify(min_heap)
+    # Create a min_heap from the edge_set in O(E) time
+    min_heap: MinPriorityHeap = MinPriorityHeap.from_iterable(edge_set, key=lambda edge: edge.cost)
 
     mst: list[Edge] = []
     total_vertices: int = len(edge_set) + 1
@@ -71,7 +72,7 @@ def kruskals(edges: dict[int, list[tuple[int, int]]]) -> list[Edge]:
     uf: UnionFind = UnionFind(total_vertices)
 
     while min_heap and len(mst) < total_vertices - 1:
-        edge: Edge = heapq.heappop(min_heap)
+        edge: Edge = min_heap.pop()
 
         # Make sure this adding this edge does not create a cycle
         if not uf.connected(edge.src, edge.dst):
@@ -2,8 +2,11 @@
 An implementation of Prim's Algorithm to create Minimum Spanning Trees
 """
 
-from collections import deque
-import heapq
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data_structures"))
+from heap import IndexedMinHeap # pylint: disable=wrong-import-position,import-error
 
 class Edge:
     """
@@ -33,38 +36,45 @@ def prims(edges: dict[int, list[tuple[int, int]]]) -> list[Edge]:
     """
     Constructs a minimum spanning tree given the edges of a graph
 
-    1. Use two sets, one to track visited vertices and one to track un-visited vertices
-        - Here we use an array instead
-    2. Out of all edges that connect the vertices in the visited set with the vertices in the
-    un-visited set, choose the edge with the smallest weight
+    1. Start from any vertex and keep a frontier of the vertices not yet in the tree
+    2. Each frontier vertex is keyed by the cheapest edge that connects it to the tree
+        - The frontier is an indexed heap so a cheaper edge lowers the key in place
+    3. Pop the vertex with the cheapest connecting edge, add that edge to the mst and
+    relax the keys of its neighbors
 
-    Time: O(V * log E)
-        Loop over all vertices and then get the edges from the heap
-    Space: O(V + E)
-        Need to store V vertices and E edges
+    Time: O(E * log V)
+        Every edge can cause a decrease_key on a heap that holds at most V vertices
+    Space: O(V)
+        The heap and the cheapest edge table hold at most one entry per vertex
     """
+    if not edges:
+        return []
+
+    visited_vertices: set[int] = set()
+    # Maps a frontier vertex to the cheapest edge connecting it to the tree
+    cheapest_edges: dict[int, Edge] = {}
+    frontier: IndexedMinHeap = IndexedMinHeap()
+    frontier.add(next(iter(edges)), 0)
+    mst: list[Edge] = []
+
+    while frontier:
+        vertex: int = frontier.pop()
+        visited_vertices.add(vertex)
+        if vertex in cheapest_edges:
+            mst.append(cheapest_edges.pop(vertex))
 
-    unvisited_vertices: list = list(edges.keys())
-    num_vertices: int = len(edges)
-    # Used to track the smallest edges that span the two sets
-    min_heap: list = []
-    mst: set = set()
+        for dst, cost in edges[vertex]:
+            if dst in visited_vertices:
+                continue
 
-    while unvisited_vertices and len(mst) < num_vertices - 1:
-        vertex: int = unvisited_vertices.pop()
+            if dst not in frontier:
+                frontier.add(dst, cost)
+                cheapest_edges[dst] = Edge(vertex, dst, cost)
+            elif cost < frontier.get_priority(dst):
+                frontier.decrease_key(dst, cost)
+                cheapest_edges[dst] = Edge(vertex, dst, cost)
 
-        # Now get all edges from visited_set to unvisited_set
-        for dst, cost in edges[vertex]:
-            new_edge: Edge = Edge(vertex, dst, cost)
-            # Only want to add the edge if it is not already considered nor
-            # if it was already added to the mst
-            if new_edge not in mst:
-                heapq.heappush(min_heap, new_edge)
-        # Find the smallest edge in O(log E) time
-        smallest_edge: Edge = heapq.heappop(min_heap)
-        mst.add(smallest_edge)
-
-    return list(mst)
+    return mst
 
 
 if __name__ == "__main__":
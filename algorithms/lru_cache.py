@@ -3,8 +3,15 @@
 """
 Taken from Leetcode 146
 """
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data_structures"))
+from linked_list import NodePool
 
 class ListNode:
+    __slots__ = ("key", "val", "prev", "next")
+
     def __init__(self, key: int, val: int) -> None:
         self.key: int = key
         self.val: int = val
@@ -62,11 +69,13 @@ class LRUCache:
     The get and put operations occur in O(1) time
     When the capacity is exceeded, evict the last accessed value from the cache
     The LRU item is at the head of the DLL. The most recently used is at the tail.
+    Evicted nodes go into a pool and are reused for the next new key.
     """
     def __init__(self, capacity: int) -> None:
         self.dll: DLL = DLL()
         self.lookup: dict[int, ListNode] = {}
         self.capacity: int = capacity
+        self.pool: NodePool = NodePool(ListNode, max_size=1)
 
     def get(self, key: int) -> int:
         """
@@ -87,15 +96,22 @@ class LRUCache:
         Add a new key value pair into the cache
         """
         if key in self.lookup:
-            self.dll.remove(self.lookup[key])
+            # Update the existing node in place and move it to the end
+            found_node: ListNode = self.lookup[key]
+            found_node.val = val
+            self.dll.remove(found_node)
+            self.dll.add(found_node)
+            return
 
-        new_node: ListNode = ListNode(key, val)
+        new_node: ListNode = self.pool.acquire(key, val)
         self.lookup[key] = new_node
         self.dll.add(new_node)
 
         if len(self.dll) > self.capacity:
-            del self.lookup[self.dll.head.next.key]
-            self.dll.remove(self.dll.head.next)
+            lru_node: ListNode = self.dll.head.next
+            del self.lookup[lru_node.key]
+            self.dll.remove(lru_node)
+            self.pool.release(lru_node)
 
         return
 
@@ -0,0 +1,93 @@
+"""
+K-way merges of sorted linked lists and sorted iterators using a MinHeap
+
+The heap holds one (value, source index) entry per source, the smallest value not yet
+merged from that source. Each step takes the smallest entry and replaces it with the next
+value from the same source, so the heap never holds more than k entries.
+The source index breaks ties, which keeps the merge stable.
+
+Time:   O(N log k) for N values in k sources
+Space:  O(k)
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data_structures"))
+from heap import MinHeap # pylint: disable=wrong-import-position,import-error
+from linked_list import Node, SLL # pylint: disable=wrong-import-position,import-error
+
+
+def merge_sorted_lists(lists: list[SLL]) -> SLL:
+    """
+    Merges sorted SLLs into one sorted SLL by relinking their nodes, no new Nodes are made
+    The input lists are left empty
+    """
+    heads: list[Node] = [sll.head for sll in lists]
+    heap: MinHeap = MinHeap.from_iterable((node.val, index) for index, node in enumerate(heads) if node)
+
+    merged: SLL = SLL(None)
+    while len(heap):
+        _, index = heap.peek()
+        node: Node = heads[index]
+        heads[index] = node.next
+        if node.next:
+            heap.replace((node.next.val, index))
+        else:
+            heap.pop()
+
+        node.next = None
+        if merged.tail:
+            merged.add(node)
+        else:
+            merged.head = node
+            merged.tail = node
+
+    for sll in lists:
+        sll.head = None
+        sll.tail = None
+    return merged
+
+
+def merge_sorted_iterators(*iterables, key=None):
+    """
+    Lazily yields the values of sorted iterables in sorted order, like heapq.merge
+    Only one value from each iterable is read ahead at a time
+    If key is given, values are compared by key(value) instead
+    """
+    iterators: list = [iter(iterable) for iterable in iterables]
+    current: list = [None] * len(iterators)   # The next value of each iterator
+    entries: list[tuple] = []
+    for index, iterator in enumerate(iterators):
+        for val in iterator:
+            current[index] = val
+            entries.append((val if key is None else key(val), index))
+            break
+    heap: MinHeap = MinHeap.from_iterable(entries)
+
+    while len(heap):
+        _, index = heap.peek()
+        yield current[index]
+        for val in iterators[index]:
+            current[index] = val
+            heap.replace((val if key is None else key(val), index))
+            break
+        else:
+            current[index] = None
+            heap.pop()
+
+
+if __name__ == "__main__":
+    shards: list[SLL] = []
+    for values in [[1, 4, 7], [2, 5, 8], [3, 6, 9], []]:
+        sll: SLL = SLL(None)
+        for val in values:
+            sll.append(val)
+        shards.append(sll)
+
+    merged_list: SLL = merge_sorted_lists(shards)
+    merged_list.print()     # 1 through 9
+
+    print(list(merge_sorted_iterators([1, 3, 5], range(0, 10, 4), iter([2, 2, 6]))))   # [0, 1, 2, 2, 3, 4, 5, 6, 8]
+    # Each input is sorted longest word first, so the merge is too
+    print(list(merge_sorted_iterators(["banana", "kiwi"], ["apple", "fig"], key=lambda word: -len(word))))    # ['banana', 'apple', 'kiwi', 'fig']
@@ -0,0 +1,208 @@
+"""
+Implements a Bloom filter and wrappers that put one in front of HashTable and Trie lookups
+A Bloom filter is a bit array that answers "is this key definitely not in the set?" without
+storing the keys. Adding a key sets k bits, and a lookup checks those same k bits. If any bit
+is unset the key was never added, otherwise it was probably added.
+
+The k bit positions come from a single 64-bit hash split into two halves h1 and h2,
+with position i = h1 + i * h2 (double hashing), so the key is only hashed once.
+
+For n keys and a false positive rate p the filter needs m = -n * ln(p) / ln(2)^2 bits
+and k = (m / n) * ln(2) hash positions. m is rounded up to a power of two, so any odd h2 is
+coprime with m and the k positions of a key are all different.
+
+add/contains:   O(k) time
+Space:          O(m) bits
+"""
+import math
+from hash_table import HashTable, mix64, MASK_64
+from trie import Trie, MARKER
+
+ERROR_RATE: float = 0.01
+CAPACITY: int = 1024
+
+
+class BloomFilter:
+    """
+    The BloomFilter class
+    It is sized to hold capacity keys with the given false positive rate. Adding more keys
+    than that still works but the false positive rate goes up.
+    It also counts how many of its lookups were negative, positive and false positives.
+    """
+    def __init__(self, capacity: int = CAPACITY, error_rate: float = ERROR_RATE) -> None:
+        self.capacity: int = max(1, capacity)
+        self.error_rate: float = error_rate
+        min_bits: int = max(8, math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_bits: int = 1 << (min_bits - 1).bit_length()
+        self.mask: int = self.num_bits - 1
+        self.num_hashes: int = max(1, round((self.num_bits / self.capacity) * math.log(2)))
+        self.bits: bytearray = bytearray((self.num_bits + 7) // 8)
+
+        self.negatives: int = 0
+        self.positives: int = 0
+        self.false_positives: int = 0
+
+    def positions(self, key: str):
+        """
+        Yields the k bit positions of the key
+        """
+        hash_val: int = mix64(hash(key) & MASK_64)
+        first: int = hash_val & 0xffffffff
+        # An odd step is coprime with the power of two num_bits, so no position repeats
+        # until all num_bits of them have been used
+        second: int = (hash_val >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (first + (i * second)) & self.mask
+
+    def add(self, key: str) -> None:
+        """
+        Sets the bits of the key
+        """
+        for position in self.positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, key: str) -> bool:
+        """
+        Returns False if the key was definitely never added, True if it probably was
+        """
+        for position in self.positions(key):
+            if not self.bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        """
+        The same as might_contain() but counted in the lookup stats
+        """
+        if self.might_contain(key):
+            self.positives += 1
+            return True
+        self.negatives += 1
+        return False
+
+    def rebuild(self, capacity: int, keys) -> 'BloomFilter':
+        """
+        Returns a new filter with room for capacity keys holding every key given
+        The lookup counts are carried over
+        """
+        new_filter: BloomFilter = BloomFilter(capacity, self.error_rate)
+        for key in keys:
+            new_filter.add(key)
+        new_filter.negatives = self.negatives
+        new_filter.positives = self.positives
+        new_filter.false_positives = self.false_positives
+        return new_filter
+
+    def stats(self) -> dict:
+        """
+        Reports how many lookups the filter answered and how many it wrongly let through
+        """
+        lookups: int = self.negatives + self.positives
+        return {
+            "bits": self.num_bits,
+            "hashes": self.num_hashes,
+            "lookups": lookups,
+            "negatives": self.negatives,
+            "positives": self.positives,
+            "false_positives": self.false_positives,
+            "skipped_rate": self.negatives / lookups if lookups else 0.0,
+        }
+
+
+class FilteredHashTable(HashTable):
+    """
+    A HashTable that checks a Bloom filter before walking a bucket
+    Misses for keys that were never added skip the bucket entirely.
+    Deleted keys stay in the filter, which only costs an occasional false positive.
+    The filter is rebuilt with double the capacity once it holds more keys than it was sized for.
+    """
+    def __init__(self, *args, capacity: int = CAPACITY, error_rate: float = ERROR_RATE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.filter: BloomFilter = BloomFilter(capacity, error_rate)
+
+    def add(self, key: str, val) -> None:
+        super().add(key, val)
+        self.filter.add(key)
+        if self.count > self.filter.capacity:
+            self.filter = self.filter.rebuild(self.filter.capacity * 2, self.keys())
+
+    def setdefault(self, key: str, default=None):
+        if key not in self.filter:
+            self.add(key, default)
+            return default
+        return super().setdefault(key, default)
+
+    def get(self, key: str):
+        if key not in self.filter:
+            return None
+        _, node, _ = self.find(key)
+        if not node:
+            self.filter.false_positives += 1
+            return None
+        return node.val
+
+    def __contains__(self, key: str) -> bool:
+        if key not in self.filter:
+            return False
+        if not super().__contains__(key):
+            self.filter.false_positives += 1
+            return False
+        return True
+
+
+class FilteredTrie(Trie):
+    """
+    A Trie that checks a Bloom filter of its whole words before walking the trie
+    The filter is rebuilt with double the capacity once it holds more words than it was sized for.
+    """
+    def __init__(self, capacity: int = CAPACITY, error_rate: float = ERROR_RATE) -> None:
+        super().__init__()
+        self.filter: BloomFilter = BloomFilter(capacity, error_rate)
+        self.num_words: int = 0
+
+    def insert(self, add_string: str) -> None:
+        # Ask the trie rather than the filter, which would miss new words that are false positives
+        if not super().contains(add_string):
+            self.num_words += 1
+        super().insert(add_string)
+        self.filter.add(add_string)
+        if self.num_words > self.filter.capacity:
+            self.filter = self.filter.rebuild(self.filter.capacity * 2, self.words())
+
+    def contains(self, search_string: str) -> bool:
+        if search_string not in self.filter:
+            return False
+        if not super().contains(search_string):
+            self.filter.false_positives += 1
+            return False
+        return True
+
+    def words(self):
+        """
+        Yields every word in the trie
+        """
+        levels: list[dict] = [self.root]
+        while levels:
+            level: dict = levels.pop()
+            for char, child in level.items():
+                if char == MARKER:
+                    yield child
+                else:
+                    levels.append(child)
+
+
+if __name__ == "__main__":
+    my_table = FilteredHashTable(capacity=100, error_rate=0.01)
+    for i in range(100):
+        my_table[f"key{i}"] = i
+
+    found: int = sum(my_table.get(f"key{i}") is not None for i in range(100))
+    missing: int = sum(my_table.get(f"missing{i}") is not None for i in range(10_000))
+    print(found, missing)   # 100 0
+    print(my_table.filter.stats())
+
+    trie = FilteredTrie()
+    for token in "this is a big string".split(" "):
+        trie.insert(token)
+    print([trie.contains(word) for word in ["this", "yo", "is", "a", "bigger", "string", "kappa"]])
+    print(trie.filter.stats())
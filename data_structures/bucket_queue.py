@@ -0,0 +1,90 @@
+"""
+Implements a monotone Bucket Queue (Dial's queue) for small non-negative integer priorities
+When every priority added is at most max_step larger than the last priority popped, all
+priorities in the queue fit in a window of max_step + 1 values. A circular array of that
+many buckets holds one bucket per priority, so no comparisons between items are needed.
+
+This is the case for Dijkstra's algorithm and A* with integer edge weights, where
+max_step is the largest edge weight.
+
+add:    O(1) time
+pop:    O(1) amortized time, the cursor only ever moves forward
+Space:  O(n + max_step)
+"""
+
+
+class BucketQueue:
+    """
+    The BucketQueue class
+    Priorities must be integers and can never be smaller than the last popped priority
+    start is the smallest priority that will be added, 0 by default
+    """
+    def __init__(self, max_step: int, start: int = 0) -> None:
+        if max_step < 0:
+            raise ValueError("max_step must not be negative")
+        self.num_buckets: int = max_step + 1
+        self.buckets: list[list] = [[] for _ in range(self.num_buckets)]
+        # The smallest priority that can still be in the queue
+        self.current: int = start
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, item, priority: int) -> None:
+        """
+        Places the item in the bucket for its priority
+        """
+        if not self.current <= priority < self.current + self.num_buckets:
+            raise ValueError(f"Priority {priority} is outside of [{self.current}, {self.current + self.num_buckets})")
+        self.buckets[priority % self.num_buckets].append(item)
+        self.size += 1
+
+    def pop(self):
+        """
+        Removes and returns an item with the smallest priority
+        """
+        bucket: list = self.advance()
+        self.size -= 1
+        return bucket.pop()
+
+    def peek(self):
+        """
+        Get an item with the smallest priority
+        """
+        return self.advance()[-1]
+
+    def peek_priority(self) -> int:
+        """
+        Get the smallest priority in the queue
+        """
+        self.advance()
+        return self.current
+
+    def advance(self) -> list:
+        """
+        Moves the cursor forward to the first non-empty bucket and returns it
+        """
+        if self.size == 0:
+            raise ValueError("Cannot pop from empty queue")
+        bucket: list = self.buckets[self.current % self.num_buckets]
+        while not bucket:
+            self.current += 1
+            bucket = self.buckets[self.current % self.num_buckets]
+        return bucket
+
+
+if __name__ == "__main__":
+    queue = BucketQueue(3)
+    queue.add("a", 2)
+    queue.add("b", 0)
+    queue.add("c", 3)
+    queue.add("d", 2)
+
+    print(queue.peek_priority(), queue.pop())   # 0 b
+    print(queue.peek_priority(), queue.pop())   # 2 d
+
+    # Popped priorities only go up, so new ones are allowed up to 3 past the last one
+    queue.add("e", 5)
+    while len(queue):
+        print(queue.peek_priority(), queue.pop())   # 2 a, 3 c, 5 e
@@ -0,0 +1,62 @@
+"""
+Benchmarks BucketQueue against IndexedMinHeap and heapq on a monotone workload
+
+Each step pops the item with the smallest priority and adds two new items whose priorities
+are the popped priority plus a random step of at most MAX_STEP, which is the pattern of a
+Dijkstra or A* frontier with small integer edge weights. Every queue is given the same steps.
+"""
+import heapq
+import random
+import time
+from bucket_queue import BucketQueue
+from heap import IndexedMinHeap
+
+NUM_ITEMS: int = 200_000
+MAX_STEP: int = 2
+
+
+def time_queue(queue, steps: list[int]) -> float:
+    """
+    Returns the seconds taken to run the workload against a queue with add(item, priority) and pop()
+    The priority of each popped item is looked up in a list, since pop() only returns the item
+    """
+    priorities: list[int] = [0]
+    start: float = time.perf_counter()
+    queue.add(0, 0)
+    step_index: int = 0
+    while len(queue):
+        priority: int = priorities[queue.pop()]
+        if step_index < len(steps):
+            for step in steps[step_index:step_index + 2]:
+                queue.add(len(priorities), priority + step)
+                priorities.append(priority + step)
+            step_index += 2
+    return time.perf_counter() - start
+
+
+def time_heapq(steps: list[int]) -> float:
+    """
+    Returns the seconds taken to run the workload against a heapq list of (priority, item) pairs
+    """
+    start: float = time.perf_counter()
+    heap: list = [(0, 0)]
+    num_items: int = 1
+    step_index: int = 0
+    while heap:
+        priority, _ = heapq.heappop(heap)
+        if step_index < len(steps):
+            for step in steps[step_index:step_index + 2]:
+                heapq.heappush(heap, (priority + step, num_items))
+                num_items += 1
+            step_index += 2
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    random_steps: list[int] = [random.randint(0, MAX_STEP) for _ in range(NUM_ITEMS)]
+
+    print(f"{'queue':<16}{'seconds':>10}")
+    print(f"{'BucketQueue':<16}{time_queue(BucketQueue(MAX_STEP), random_steps):>10.3f}")
+    print(f"{'IndexedMinHeap':<16}{time_queue(IndexedMinHeap(), random_steps):>10.3f}")
+    print(f"{'heapq':<16}{time_heapq(random_steps):>10.3f}")
@@ -0,0 +1,216 @@
+"""
+Implements a lock-striped concurrent string hash table for sharing between threads
+The keys are partitioned into stripes and each stripe is its own HashTable with its own lock,
+so threads working on keys in different stripes never wait on each other.
+
+Reads do not take a lock and do not write anything, they look keys up with
+HashTable.find(count=False) so the lookup stats are never touched. Every stripe has a version counter that a writer bumps once before
+and once after it changes the stripe, so the version is odd while a write is in progress.
+A reader notes the version, reads, and only trusts the result if the version is still the
+same even number afterwards. Otherwise it retries while holding the stripe's lock.
+
+get_many and put_many group their keys by stripe so each stripe's lock is taken once per batch.
+"""
+import threading
+from typing import Callable, TypeVar
+from hash_table import HashTable, mix64, MASK_64
+
+T = TypeVar('T')
+NUM_STRIPES: int = 16
+
+
+def lookup(table: HashTable, key: str) -> T:
+    """
+    Returns the value of the key in table without writing to the table
+    """
+    node = table.find(key, count=False)[1]
+    return node.val if node else None
+
+
+class Stripe:
+    """
+    One partition of the concurrent table
+    """
+    def __init__(self, hasher: Callable[[str], int]) -> None:
+        # Incremental rehashing moves buckets during reads, so it cannot be used here
+        self.table: HashTable = HashTable(hasher=hasher)
+        self.lock = threading.Lock()
+        self.version: int = 0
+
+    def read(self, reader: Callable[[HashTable], T]) -> T:
+        """
+        Runs reader against the table optimistically, falling back to the lock if
+        a writer changed the stripe in the meantime
+        """
+        version: int = self.version
+        if version % 2 == 0:
+            try:
+                result: T = reader(self.table)
+                if self.version == version:
+                    return result
+            except (IndexError, AttributeError):
+                # A resize swapped the buckets out from under us
+                pass
+        with self.lock:
+            return reader(self.table)
+
+    def write(self, writer: Callable[[HashTable], T]) -> T:
+        """
+        Runs writer against the table while holding the lock and marking the stripe as changing
+        The lock must not already be held by the caller
+        """
+        with self.lock:
+            return self.write_locked(writer)
+
+    def write_locked(self, writer: Callable[[HashTable], T]) -> T:
+        """
+        Runs writer against the table, the lock must already be held by the caller
+        """
+        self.version += 1
+        try:
+            return writer(self.table)
+        finally:
+            self.version += 1
+
+
+class ConcurrentHashTable[str, T]:
+    """
+    The ConcurrentHashTable class that maps a string key to any value val
+    It has the same add/get/__getitem__/__setitem__ interface as HashTable
+    """
+    def __init__(self, num_stripes: int = NUM_STRIPES, hasher: Callable[[str], int] = hash) -> None:
+        self.hasher: Callable[[str], int] = hasher
+        self.stripes: list[Stripe] = [Stripe(hasher) for _ in range(num_stripes)]
+
+    def stripe_index(self, key: str) -> int:
+        """
+        The index of the stripe that owns the key
+        The hash is mixed first so hashers that only produce small values, such as ascii_hash,
+        still spread keys over every stripe. The high bits of the mixed hash are used since
+        the stripe's HashTable picks a bucket from the low bits of the unmixed hash.
+        """
+        return (mix64(self.hasher(key) & MASK_64) >> 32) % len(self.stripes)
+
+    def get_stripe(self, key: str) -> Stripe:
+        return self.stripes[self.stripe_index(key)]
+
+    def __len__(self) -> int:
+        return sum(len(stripe.table) for stripe in self.stripes)
+
+    def add(self, key: str, val: T) -> None:
+        """
+        Add a value into the hash table given the key, replacing the value if the key exists
+        """
+        stripe: Stripe = self.stripes[self.stripe_index(key)]
+        with stripe.lock:
+            stripe.version += 1
+            try:
+                stripe.table.add(key, val)
+            finally:
+                stripe.version += 1
+
+    def __setitem__(self, key: str, val) -> None:
+        self.add(key, val)
+
+    def get(self, key: str) -> T:
+        """
+        Return a value from the hash table given the key without taking a lock
+        This is Stripe.read() inlined as it is the most common operation
+        """
+        stripe: Stripe = self.stripes[self.stripe_index(key)]
+        version: int = stripe.version
+        if version % 2 == 0:
+            try:
+                val: T = lookup(stripe.table, key)
+                if stripe.version == version:
+                    return val
+            except (IndexError, AttributeError):
+                pass
+        with stripe.lock:
+            return lookup(stripe.table, key)
+
+    def __getitem__(self, key: str) -> T:
+        return self.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get_stripe(key).read(lambda table: table.find(key, count=False)[1] is not None)
+
+    def pop(self, key: str, *default) -> T:
+        """
+        Removes the key and returns its value, see HashTable.pop
+        """
+        return self.get_stripe(key).write(lambda table: table.pop(key, *default))
+
+    def __delitem__(self, key: str) -> None:
+        self.pop(key)
+
+    def compute_if_absent(self, key: str, compute: Callable[[str], T]) -> T:
+        """
+        Returns the value of the key, or atomically computes and adds it if the key does not exist
+        compute is called at most once per key while the stripe's lock is held
+        """
+        stripe: Stripe = self.get_stripe(key)
+        with stripe.lock:
+            _, node, _ = stripe.table.find(key, count=False)
+            if node:
+                return node.val
+            val: T = compute(key)
+            stripe.write_locked(lambda table: table.add(key, val))
+            return val
+
+    def group_by_stripe(self, entries, get_key: Callable = lambda entry: entry) -> dict[int, list]:
+        """
+        Maps each stripe index to the entries whose key belongs to it
+        """
+        groups: dict[int, list] = {}
+        for entry in entries:
+            groups.setdefault(self.stripe_index(get_key(entry)), []).append(entry)
+        return groups
+
+    def get_many(self, keys: list[str]) -> list[T]:
+        """
+        Returns the value of every key, reading each stripe once
+        """
+        results: dict[str, T] = {}
+        for index, stripe_keys in self.group_by_stripe(keys).items():
+            stripe_vals: list[T] = self.stripes[index].read(
+                lambda table, stripe_keys=stripe_keys: [lookup(table, key) for key in stripe_keys]
+            )
+            results.update(zip(stripe_keys, stripe_vals))
+        return [results[key] for key in keys]
+
+    def put_many(self, items) -> None:
+        """
+        Adds every key and value pair, taking each stripe's lock once
+        """
+        for index, stripe_items in self.group_by_stripe(items, lambda item: item[0]).items():
+            def writer(table: HashTable, stripe_items=stripe_items) -> None:
+                for key, val in stripe_items:
+                    table.add(key, val)
+            self.stripes[index].write(writer)
+
+    def items(self):
+        """
+        Yields every key and value pair, each stripe is copied under its lock first
+        """
+        for stripe in self.stripes:
+            with stripe.lock:
+                stripe_items: list = list(stripe.table.items())
+            yield from stripe_items
+
+
+if __name__ == "__main__":
+    shared_table = ConcurrentHashTable()
+
+    def writer_thread(start: int) -> None:
+        shared_table.put_many((f"key{i}", i) for i in range(start, 1000, 4))
+
+    threads: list[threading.Thread] = [threading.Thread(target=writer_thread, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(len(shared_table), shared_table["key42"])      # 1000 42
+    print(shared_table.get_many(["key1", "key2", "missing"]))     # [1, 2, None]
+    print(shared_table.compute_if_absent("key1", len), shared_table.compute_if_absent("new", len))     # 1 3
@@ -0,0 +1,73 @@
+"""
+Benchmarks ConcurrentHashTable against a HashTable behind a single lock
+as the number of reader and writer threads grows
+
+Every thread does the same number of operations, readers call get() and writers call add()
+on random keys, and the total operations per second across all threads is reported
+
+With the GIL only one thread runs Python code at a time, so there is no contention for
+striping to remove and its extra bookkeeping makes it slower than the single lock
+"""
+import random
+import threading
+import time
+from concurrent_hash_table import ConcurrentHashTable
+from hash_table import HashTable
+
+NUM_KEYS: int = 10_000
+OPS_PER_THREAD: int = 50_000
+
+
+class SingleLockHashTable:
+    """
+    A HashTable where every operation takes the same lock
+    """
+    def __init__(self) -> None:
+        self.table: HashTable = HashTable()
+        self.lock = threading.Lock()
+
+    def add(self, key: str, val) -> None:
+        with self.lock:
+            self.table.add(key, val)
+
+    def get(self, key: str):
+        with self.lock:
+            return self.table.get(key)
+
+
+def run(table, num_readers: int, num_writers: int) -> float:
+    """
+    Returns the operations per second of the readers and writers running together
+    """
+    keys: list[str] = [f"key{i}" for i in range(NUM_KEYS)]
+    for key in keys:
+        table.add(key, 0)
+
+    def reader() -> None:
+        for key in random.choices(keys, k=OPS_PER_THREAD):
+            table.get(key)
+
+    def writer() -> None:
+        for key in random.choices(keys, k=OPS_PER_THREAD):
+            table.add(key, 1)
+
+    threads: list[threading.Thread] = [threading.Thread(target=reader) for _ in range(num_readers)]
+    threads += [threading.Thread(target=writer) for _ in range(num_writers)]
+
+    start: float = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed: float = time.perf_counter() - start
+
+    return (num_readers + num_writers) * OPS_PER_THREAD / elapsed
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"{'readers':>8}{'writers':>8}{'single lock ops/s':>20}{'striped ops/s':>16}")
+    for num_readers, num_writers in [(1, 1), (2, 2), (4, 1), (4, 4), (8, 2), (8, 8)]:
+        single_lock: float = run(SingleLockHashTable(), num_readers, num_writers)
+        striped: float = run(ConcurrentHashTable(), num_readers, num_writers)
+        print(f"{num_readers:>8}{num_writers:>8}{single_lock:>20,.0f}{striped:>16,.0f}")
@@ -0,0 +1,198 @@
+"""
+Implements a bucketized Cuckoo hash table for strings
+Every key has one candidate bucket per hash function and each bucket holds a fixed number of
+slots, so a lookup checks at most num_hashes * slots_per_bucket slots no matter how full the
+table is or how the keys collide.
+
+When all candidate buckets of a new key are full, a random entry in one of them is evicted to
+make room and moved to one of its own candidate buckets, possibly evicting another entry.
+If this goes on for more than max_displacements moves, the table doubles in size and
+every entry is reinserted with fresh hash functions.
+
+get:    O(1) worst case time
+add:    O(1) amortized expected time
+Space:  O(n)
+"""
+import random
+from typing import TypeVar
+from hash_table import seeded_hash, MISSING
+
+T = TypeVar('T')
+TABLE_SIZE: int = 8
+NUM_HASHES: int = 2
+SLOTS_PER_BUCKET: int = 4
+MAX_DISPLACEMENTS: int = 250
+MAX_LOAD_FACTOR: float = 0.9
+
+
+class CuckooHashTable[str, T]:
+    """
+    The CuckooHashTable class that maps a string key to any value val
+    It has the same add/get/pop/__getitem__/__setitem__/__contains__ interface as HashTable
+    The slots are stored in two flat lists of keys and values, bucket by bucket,
+    with a key of None marking an empty slot
+    """
+    def __init__(self, size: int = TABLE_SIZE, num_hashes: int = NUM_HASHES,
+                 slots_per_bucket: int = SLOTS_PER_BUCKET, max_displacements: int = MAX_DISPLACEMENTS,
+                 seed: int = None):
+        self.num_hashes: int = num_hashes
+        self.slots_per_bucket: int = slots_per_bucket
+        self.max_displacements: int = max_displacements
+        self.random = random.Random(seed)
+        self.allocate(size)
+
+    def allocate(self, num_buckets: int) -> None:
+        """
+        Creates empty buckets and picks a new set of hash functions
+        """
+        self.num_buckets: int = num_buckets
+        self.hashers: list = [seeded_hash(self.random.getrandbits(64)) for _ in range(self.num_hashes)]
+        self.keys: list = [None] * (num_buckets * self.slots_per_bucket)
+        self.vals: list = [None] * (num_buckets * self.slots_per_bucket)
+        self.count: int = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def candidate_buckets(self, key: str) -> list[int]:
+        """
+        The bucket chosen by each hash function for the key
+        """
+        return [hasher(key) % self.num_buckets for hasher in self.hashers]
+
+    def find(self, key: str) -> int:
+        """
+        Returns the slot holding the key or -1 if it is not in the table
+        """
+        keys: list = self.keys
+        for bucket in self.candidate_buckets(key):
+            start: int = bucket * self.slots_per_bucket
+            for index in range(start, start + self.slots_per_bucket):
+                if keys[index] == key:
+                    return index
+        return -1
+
+    def add(self, key: str, val: T) -> None:
+        """
+        Add a value into the hash table given the key, replacing the value if the key exists
+        """
+        index: int = self.find(key)
+        if index != -1:
+            self.vals[index] = val
+            return
+        if self.count + 1 > len(self.keys) * MAX_LOAD_FACTOR:
+            self.resize(self.num_buckets * 2)
+        self.insert(key, val)
+
+    def __setitem__(self, key: str, val) -> None:
+        self.add(key, val)
+
+    def insert(self, key: str, val: T) -> None:
+        """
+        Places a key that is not in the table, evicting entries along the way if needed
+        """
+        slots_per_bucket: int = self.slots_per_bucket
+        while True:
+            for _ in range(self.max_displacements):
+                buckets: list[int] = self.candidate_buckets(key)
+                for bucket in buckets:
+                    start: int = bucket * slots_per_bucket
+                    for index in range(start, start + slots_per_bucket):
+                        if self.keys[index] is None:
+                            self.keys[index] = key
+                            self.vals[index] = val
+                            self.count += 1
+                            return
+
+                # Every candidate slot is full, so swap with a random one and move the evicted entry
+                index: int = (self.random.choice(buckets) * slots_per_bucket) + self.random.randrange(slots_per_bucket)
+                self.keys[index], key = key, self.keys[index]
+                self.vals[index], val = val, self.vals[index]
+
+            # Too many displacements, most likely a cycle, so grow with new hash functions
+            self.resize(self.num_buckets * 2)
+
+    def get(self, key: str) -> T:
+        """
+        Return a value from the hash table given the key
+        """
+        index: int = self.find(key)
+        return None if index == -1 else self.vals[index]
+
+    def __getitem__(self, key: str) -> T:
+        return self.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) != -1
+
+    def pop(self, key: str, default=MISSING) -> T:
+        """
+        Removes the key and returns its value
+        If the key does not exist, default is returned or a KeyError is raised if there is no default
+        """
+        index: int = self.find(key)
+        if index == -1:
+            if default is MISSING:
+                raise KeyError(key)
+            return default
+        val: T = self.vals[index]
+        self.keys[index] = None
+        self.vals[index] = None
+        self.count -= 1
+        return val
+
+    def __delitem__(self, key: str) -> None:
+        self.pop(key)
+
+    def items(self):
+        """
+        Yields every key and value pair
+        """
+        for index, key in enumerate(self.keys):
+            if key is not None:
+                yield key, self.vals[index]
+
+    def resize(self, num_buckets: int) -> None:
+        """
+        Reinserts every entry into num_buckets buckets with new hash functions
+        """
+        old_items: list = list(self.items())
+        self.allocate(num_buckets)
+        for key, val in old_items:
+            self.insert(key, val)
+
+    def stats(self) -> dict:
+        """
+        Reports how full the table is and the most slots a lookup can check
+        """
+        return {
+            "buckets": self.num_buckets,
+            "entries": self.count,
+            "load_factor": self.count / len(self.keys),
+            "max_slots_per_lookup": self.num_hashes * self.slots_per_bucket,
+        }
+
+    def print(self):
+        """
+        Prints the hash table
+        """
+        for key, val in self.items():
+            print(f"Key={key}, Val={val}")
+
+
+if __name__ == "__main__":
+    my_table = CuckooHashTable(seed=0)
+
+    names = [("Liam", "Cuozzo"), ("Pat", "Limerick"), ("Mike", "Carlucci")]
+    for name in names:
+        my_table.add(*name)
+    my_table.print()
+    print()
+
+    my_table["Finn"] = "Cuozzo"
+    my_table["Finn"] = "Limerick"     # Replaces the value in place
+    print(my_table["Finn"], my_table.pop("Pat"), "Pat" in my_table)     # Limerick Limerick False
+
+    for i in range(1000):
+        my_table[f"key{i}"] = i
+    print(my_table["key42"], my_table.stats())
@@ -0,0 +1,239 @@
+"""
+Implements an external memory MinHeap that spills to disk
+New items go into an in-memory heap buffer. When the buffer holds buffer_size items it is
+sorted and written out to a run file, so memory use is bounded by the buffer no matter how
+many items are queued. Runs are read back through mmap and a small heap of run heads does a
+k-way merge of the runs and the buffer when popping.
+
+Items are numbers stored with an array typecode, such as "q" for 64-bit integers or "d"
+for floats, so each run is a flat binary file that can be mapped without deserializing.
+
+Spilled runs are on level 0. Once a level has more than max_runs runs they are merged into
+a single run on the next level, so runs are only ever merged with runs of about the same
+size and each value is rewritten O(log n / log max_runs) times rather than on every merge.
+
+add:    O(log B) time, plus an O(B log B) spill every B items
+pop:    O(log B + log R) time for a buffer of B items and R runs
+Space:  O(B + R) in memory, O(n) on disk, with R = O(max_runs * log n) runs
+"""
+from array import array
+import mmap
+import os
+import random
+import shutil
+import tempfile
+from heap import DaryMinHeap, MinPriorityHeap
+
+
+class Run:
+    """
+    A sorted run file that is read through mmap from the front
+    level is the number of merges its values have been through
+    """
+    def __init__(self, path: str, typecode: str, level: int = 0) -> None:
+        self.path: str = path
+        self.level: int = level
+        self.file = open(path, "rb")    # pylint: disable=consider-using-with
+        self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.values: memoryview = memoryview(self.mmap).cast(typecode)
+        self.position: int = 0
+
+    def __len__(self) -> int:
+        return len(self.values) - self.position
+
+    def peek(self):
+        """
+        Get the smallest value left in the run
+        """
+        return self.values[self.position]
+
+    def pop(self):
+        """
+        Removes and returns the smallest value left in the run
+        """
+        val = self.values[self.position]
+        self.position += 1
+        return val
+
+    def close(self) -> None:
+        """
+        Unmaps and deletes the run file
+        """
+        self.values.release()
+        self.mmap.close()
+        self.file.close()
+        os.remove(self.path)
+
+
+class ExternalHeap:
+    """
+    The ExternalHeap class
+    It has the same add/pop/peek/__len__ interface as the heaps in heap.py.
+    Once a level has more than max_runs runs they are merged into one run on the next level,
+    which keeps the number of open files and the size of the run head heap small.
+    Use it as a context manager, or call close(), to delete the run files.
+    """
+    def __init__(self, buffer_size: int = 1_000_000, typecode: str = "q",
+                 directory: str = None, max_runs: int = 64) -> None:
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.buffer_size: int = buffer_size
+        self.typecode: str = typecode
+        self.max_runs: int = max_runs
+        self.directory: str = tempfile.mkdtemp(prefix="external_heap_", dir=directory)
+        self.num_run_files: int = 0
+
+        self.buffer: DaryMinHeap = DaryMinHeap()
+        # Every item is stored here first so one the typecode can't hold is rejected by add()
+        # instead of breaking the next spill
+        self.checked: array = array(typecode, [0])
+        # Each run is keyed by the smallest value left in it
+        self.run_heads: MinPriorityHeap = MinPriorityHeap(typecode=typecode)
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> 'ExternalHeap':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def add(self, item) -> None:
+        """
+        Adds the item to the in-memory buffer, spilling the buffer to a run first if it is full
+        Raises a TypeError or OverflowError if the typecode cannot hold the item
+        """
+        self.checked[0] = item
+        if len(self.buffer) >= self.buffer_size:
+            self.spill()
+        # Buffer the converted value so items read the same before and after a spill
+        self.buffer.add(self.checked[0])
+        self.size += 1
+
+    def peek(self):
+        """
+        Get the smallest value of the heap
+        """
+        if self.size == 0:
+            raise ValueError("Cannot peek an empty heap")
+        if self.run_heads and (not self.buffer or self.run_heads.peek_priority() < self.buffer.peek()):
+            return self.run_heads.peek_priority()
+        return self.buffer.peek()
+
+    def pop(self):
+        """
+        Removes and returns the smallest of the buffer's root and the run heads
+        """
+        if self.size == 0:
+            raise ValueError("Cannot pop from empty heap")
+        self.size -= 1
+
+        if self.run_heads and (not self.buffer or self.run_heads.peek_priority() < self.buffer.peek()):
+            run: Run = self.run_heads.peek()
+            val = run.pop()
+            if len(run):
+                self.run_heads.replace(run, run.peek())
+            else:
+                self.run_heads.pop()
+                run.close()
+            return val
+        return self.buffer.pop()
+
+    def spill(self) -> None:
+        """
+        Writes the buffer out as a sorted run and empties it
+        """
+        if not self.buffer:
+            return
+        self.buffer.items.sort()
+        self.write_run(array(self.typecode, self.buffer.items))
+        self.buffer.items = []
+
+        # A merge can fill up the next level, so keep going up while levels are full
+        level: int = 0
+        while sum(run.level == level for run in self.run_heads.items) > self.max_runs:
+            self.compact(level)
+            level += 1
+
+    def compact(self, level: int = 0) -> None:
+        """
+        Merges every run on the level into a single run on the next level,
+        writing buffer_size values at a time
+        """
+        runs: list[Run] = self.run_heads.items
+        self.run_heads = MinPriorityHeap.from_iterable(
+            [run for run in runs if run.level != level], key=Run.peek, typecode=self.typecode
+        )
+        merging: MinPriorityHeap = MinPriorityHeap.from_iterable(
+            [run for run in runs if run.level == level], key=Run.peek, typecode=self.typecode
+        )
+
+        path: str = self.next_run_path()
+        with open(path, "wb") as run_file:
+            chunk: array = array(self.typecode)
+            while merging:
+                run: Run = merging.peek()
+                chunk.append(run.pop())
+                if len(run):
+                    merging.replace(run, run.peek())
+                else:
+                    merging.pop()
+                    run.close()
+
+                if len(chunk) >= self.buffer_size:
+                    chunk.tofile(run_file)
+                    chunk = array(self.typecode)
+            chunk.tofile(run_file)
+        self.open_run(path, level + 1)
+
+    def write_run(self, values: array) -> None:
+        """
+        Writes sorted values to a new run file and adds it to the run heads
+        """
+        path: str = self.next_run_path()
+        with open(path, "wb") as run_file:
+            values.tofile(run_file)
+        self.open_run(path)
+
+    def open_run(self, path: str, level: int = 0) -> None:
+        run: Run = Run(path, self.typecode, level)
+        self.run_heads.add(run, run.peek())
+
+    def next_run_path(self) -> str:
+        self.num_run_files += 1
+        return os.path.join(self.directory, f"run_{self.num_run_files}.bin")
+
+    def close(self) -> None:
+        """
+        Closes and deletes every run file
+        """
+        while self.run_heads:
+            self.run_heads.pop().close()
+        self.buffer.items = []
+        self.size = 0
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    values: list[int] = [random.randint(-1000, 1000) for _ in range(10_000)]
+
+    # Only 500 values are ever held in memory, the rest are spilled to run files
+    with ExternalHeap(buffer_size=500, max_runs=8) as external_heap:
+        for val in values:
+            external_heap.add(val)
+        print(len(external_heap), len(external_heap.run_heads))
+
+        popped: list[int] = [external_heap.pop() for _ in range(len(external_heap))]
+        print(popped == sorted(values))     # True
+
+    # A value the typecode can't hold is rejected by add() itself and the heap keeps working
+    with ExternalHeap(buffer_size=2) as external_heap:
+        try:
+            external_heap.add(1.5)
+        except TypeError as error:
+            print(error)    # 'float' object cannot be interpreted as an integer
+        for val in [3, 2, 1]:
+            external_heap.add(val)
+        print([external_heap.pop() for _ in range(len(external_heap))])    # [1, 2, 3]
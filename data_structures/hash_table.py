@@ -2,17 +2,41 @@
 Implements a very basic string hash table
 It is implemented here with an array that can be indexed into and then
 the array points to a linked list where the value lives
+
+The array of buckets grows (or shrinks) geometrically whenever the load factor,
+the number of entries per bucket, crosses a threshold. This keeps the linked
+lists short, so add and get stay O(1) on average however many keys are stored.
+
+The hash function is pluggable. Any callable that maps a string to an int can be
+given as the hasher, such as the builtin hash, fnv1a_hash or a seeded_hash.
+
+With incremental=True a resize does not move every node at once. The old and new
+bucket arrays are kept side by side and each operation moves the next rehash_step
+buckets across, so no single add or get pays for rehashing the whole table.
 """
+from collections import Counter
 from dataclasses import dataclass
-from typing import TypeVar
+from typing import Callable, TypeVar
+from linked_list import NodePool
 
 T = TypeVar('T')
 TABLE_SIZE: int = 10
+MAX_LOAD_FACTOR: float = 0.75
+MIN_LOAD_FACTOR: float = 0.1
+GROWTH_FACTOR: int = 2
+REHASH_STEP: int = 4
+
+FNV_OFFSET_BASIS: int = 0xcbf29ce484222325
+FNV_PRIME: int = 0x100000001b3
+MASK_64: int = (1 << 64) - 1
+
+# Marks that no default was given to pop()
+MISSING: object = object()
 
 # These Node and SLL classes are the same from linked_list,
 # but Node has both a key and a value as the key is needed
 # for the hash table too
-@dataclass
+@dataclass(slots=True)
 class Node[T]:
     """
     A pointer to hold a value and the next and previous pointers of
@@ -44,6 +68,18 @@ class SLL:
             self.tail.next = node
             self.tail = node
 
+    def remove(self, node: Node, prev: Node) -> None:
+        """
+        Unlinks a node from the SLL given the node before it, or None if it is the head
+        """
+        if prev:
+            prev.next = node.next
+        else:
+            self.head = node.next
+        if self.tail is node:
+            self.tail = prev
+        node.next = None
+
     def print(self) -> None:
         """
         Prints the whole list from head to end
@@ -56,16 +92,92 @@ class SLL:
 class HashTable[str, T]:
     """
     The HashTable class that maps a string key to any value val
+    The table starts with size buckets and is resized by GROWTH_FACTOR when the
+    load factor goes above max_load_factor or below min_load_factor
+    Every get() counts the nodes it visits so stats() can report the average probe count
+    If a NodePool of hash_table Nodes is given, removed nodes are recycled through it.
+    A pool of any other node type raises a ValueError.
     """
-    def __init__(self):
-        self.table = [SLL(None) for _ in range(TABLE_SIZE)]
+    def __init__(self, size: int = TABLE_SIZE, max_load_factor: float = MAX_LOAD_FACTOR,
+                 min_load_factor: float = MIN_LOAD_FACTOR, hasher: Callable[[str], int] = hash,
+                 incremental: bool = False, rehash_step: int = REHASH_STEP, pool: NodePool = None):
+        if pool is not None:
+            pool.check_node_type(Node)
+        self.hasher: Callable[[str], int] = hasher
+        self.pool: NodePool = pool
+        self.incremental: bool = incremental
+        self.rehash_step: int = rehash_step
+        # While rehashing incrementally, old_table holds the buckets not yet moved
+        # from rehash_index onwards and self.table is the new bucket array
+        self.old_table: list[SLL] = None
+        self.rehash_index: int = 0
+        self.lookups: int = 0
+        self.probes: int = 0
+        self.initial_size: int = size
+        self.max_load_factor: float = max_load_factor
+        self.min_load_factor: float = min_load_factor
+        self.count: int = 0
+        self.table = [SLL(None) for _ in range(size)]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def new_node(self, key: str, val: T) -> Node:
+        """
+        Returns a Node holding the key and value, taken from the pool if there is one
+        """
+        return self.pool.acquire(key, val) if self.pool is not None else Node(key, val)
+
+    def find(self, key: str, count: bool = True) -> tuple[SLL, Node, Node]:
+        """
+        Returns the bucket for the key, the key's node and the node before it
+        The node is None if the key is not in the table, in which case the bucket
+        is where the key would be added
+        While rehashing, the key's bucket in the old table is checked too
+        With count=False the lookup is not added to the stats, so on a table that is not
+        rehashing incrementally it does not write to the table at all
+        """
+        if self.old_table:
+            self.rehash_buckets(self.rehash_step)
+
+        hash_val: int = self.hasher(key)
+        new_sll: SLL = self.table[hash_val % len(self.table)]
+        buckets: list[SLL] = [new_sll]
+        if self.old_table:
+            buckets.append(self.old_table[hash_val % len(self.old_table)])
+
+        probes: int = 0
+        for sll in buckets:
+            prev: Node = None
+            node: Node = sll.head
+            while node:
+                probes += 1
+                if node.key == key:
+                    break
+                prev = node
+                node = node.next
+            if node:
+                break
+        else:
+            sll, prev = new_sll, None
+
+        if count:
+            self.lookups += 1
+            self.probes += probes
+        return sll, node, prev
 
     def add(self, key: str, val: T) -> None:
         """
         Add a value into the hash table given the key
+        If the key already exists its value is replaced, so each key has a single node
         """
-        index: int = ascii_hash(key) % TABLE_SIZE
-        self.table[index].add(Node(key, val))
+        sll, node, _ = self.find(key)
+        if node:
+            node.val = val
+            return
+        sll.add(self.new_node(key, val))
+        self.count += 1
+        self.check_load_factor()
 
     def __setitem__(self, key: str, val) -> None:
         self.add(key, val)
@@ -74,17 +186,184 @@ class HashTable[str, T]:
         """
         Return a value from the hash table given the key
         """
-        index: int = ascii_hash(key) % TABLE_SIZE
-        node: Node = self.table[index].head
-        while node:
-            if node.key == key:
-                return node.val
-            node = node.next
-        return None
+        _, node, _ = self.find(key)
+        return node.val if node else None
 
     def __getitem__(self, key: str) -> T:
         return self.get(key)
 
+    def __contains__(self, key: str) -> bool:
+        return self.find(key)[1] is not None
+
+    def pop(self, key: str, default=MISSING) -> T:
+        """
+        Removes the key and returns its value
+        If the key does not exist, default is returned or a KeyError is raised if there is no default
+        """
+        sll, node, prev = self.find(key)
+        if not node:
+            if default is MISSING:
+                raise KeyError(key)
+            return default
+        sll.remove(node, prev)
+        self.count -= 1
+        self.check_load_factor()
+        val: T = node.val
+        if self.pool is not None:
+            self.pool.release(node)
+        return val
+
+    def __delitem__(self, key: str) -> None:
+        self.pop(key)
+
+    def setdefault(self, key: str, default: T = None) -> T:
+        """
+        Returns the value of the key, first adding it with the default value if it does not exist
+        """
+        sll, node, _ = self.find(key)
+        if node:
+            return node.val
+        sll.add(self.new_node(key, default))
+        self.count += 1
+        self.check_load_factor()
+        return default
+
+    def items(self):
+        """
+        Yields every key and value pair
+        """
+        for sll in self.table + (self.old_table or []):
+            node: Node = sll.head
+            while node:
+                yield node.key, node.val
+                node = node.next
+
+    def keys(self):
+        """
+        Yields every key
+        """
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        """
+        Yields every value
+        """
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self):
+        return self.keys()
+
+    def load_factor(self) -> float:
+        """
+        The average number of nodes in each bucket
+        """
+        return self.count / len(self.table)
+
+    def check_load_factor(self) -> None:
+        """
+        Grows the table if it is too full, or shrinks it if it is too empty
+        The table never shrinks below the size it was created with
+        A new resize is not started until an incremental rehash has finished
+        """
+        if self.old_table:
+            return
+        if self.load_factor() > self.max_load_factor:
+            size: int = len(self.table) * GROWTH_FACTOR
+        elif self.load_factor() < self.min_load_factor and len(self.table) > self.initial_size:
+            size: int = max(self.initial_size, len(self.table) // GROWTH_FACTOR)
+        else:
+            return
+
+        if self.incremental:
+            self.old_table = self.table
+            self.rehash_index = 0
+            self.table = [SLL(None) for _ in range(size)]
+        else:
+            self.resize(size)
+
+    def resize(self, size: int) -> None:
+        """
+        Moves every node into a new array of size buckets
+        The nodes are relinked into their new buckets rather than copied
+        """
+        self.finish_rehash()
+        new_table: list[SLL] = [SLL(None) for _ in range(size)]
+        for sll in self.table:
+            self.move_bucket(sll, new_table)
+        self.table = new_table
+
+    def move_bucket(self, sll: SLL, new_table: list[SLL]) -> None:
+        """
+        Relinks every node of a bucket into its bucket in new_table
+        """
+        node: Node = sll.head
+        while node:
+            next_node: Node = node.next
+            node.next = None
+            new_table[self.hasher(node.key) % len(new_table)].add(node)
+            node = next_node
+        sll.head = None
+        sll.tail = None
+
+    def rehash_buckets(self, num_buckets: int) -> None:
+        """
+        Moves the next num_buckets buckets of the old table into the new table
+        """
+        end: int = min(self.rehash_index + num_buckets, len(self.old_table))
+        for index in range(self.rehash_index, end):
+            self.move_bucket(self.old_table[index], self.table)
+        self.rehash_index = end
+        if self.rehash_index == len(self.old_table):
+            self.old_table = None
+
+    def finish_rehash(self) -> None:
+        """
+        Moves every bucket left in the old table into the new table
+        """
+        if self.old_table:
+            self.rehash_buckets(len(self.old_table))
+
+    def chain_lengths(self) -> Counter:
+        """
+        A histogram that maps a chain length to the number of buckets with that length
+        """
+        lengths: Counter = Counter()
+        for sll in self.table + (self.old_table or []):
+            length: int = 0
+            node: Node = sll.head
+            while node:
+                length += 1
+                node = node.next
+            lengths[length] += 1
+        return lengths
+
+    def stats(self) -> dict:
+        """
+        Reports how well the keys are spread over the buckets
+        A max_chain_length far above the load factor points at a bad hasher or
+        a pathological set of keys
+        """
+        lengths: Counter = self.chain_lengths()
+        return {
+            "buckets": len(self.table),
+            "entries": self.count,
+            "load_factor": self.load_factor(),
+            "rehashing": self.old_table is not None,
+            "chain_lengths": dict(sorted(lengths.items())),
+            "max_chain_length": max(lengths),
+            "lookups": self.lookups,
+            "average_probes": self.probes / self.lookups if self.lookups else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        """
+        Resets the lookup and probe counters
+        """
+        self.lookups = 0
+        self.probes = 0
+
     def print(self):
         """
         Prints the hash table
@@ -101,6 +380,34 @@ def ascii_hash(string: str) -> int:
         hash_val += ord(ch) + i
     return hash_val
 
+def fnv1a_hash(string: str) -> int:
+    """
+    The 64-bit FNV-1a hash of the string's UTF-8 bytes
+    Unlike the builtin hash it gives the same value in every process
+    """
+    hash_val: int = FNV_OFFSET_BASIS
+    for byte in string.encode():
+        hash_val = ((hash_val ^ byte) * FNV_PRIME) & MASK_64
+    return hash_val
+
+def mix64(val: int) -> int:
+    """
+    The splitmix64 finalizer, which spreads every input bit across all 64 output bits
+    """
+    val = ((val ^ (val >> 30)) * 0xbf58476d1ce4e5b9) & MASK_64
+    val = ((val ^ (val >> 27)) * 0x94d049bb133111eb) & MASK_64
+    return val ^ (val >> 31)
+
+def seeded_hash(seed: int) -> Callable[[str], int]:
+    """
+    Returns a hasher that mixes the builtin hash with a seed
+    Hashers with different seeds are independent, which is needed by schemes
+    that use more than one hash function
+    """
+    def hasher(string: str) -> int:
+        return mix64((hash(string) ^ seed) & MASK_64)
+    return hasher
+
 if __name__ == "__main__":
     my_table = HashTable()
     my_table.print()
@@ -113,7 +420,44 @@ if __name__ == "__main__":
     my_table.print()
     print()
 
+    # Adding many keys grows the table so each bucket stays short
+    for i in range(100):
+        my_table[f"key{i}"] = i
+    print(len(my_table.table), my_table.load_factor())
+    print(my_table["key42"])
+
     my_table["Finn"] = "Cuozzo"
     print(my_table["Finn"])
     my_table["nniF"] = "ozzuoC"
     print(my_table["nniF"])
+    print(my_table.stats())
+
+    # Writing to an existing key replaces its value rather than adding another node
+    my_table["Finn"] = "Limerick"
+    print(my_table["Finn"], len(my_table))
+    print(my_table.pop("Finn"), "Finn" in my_table, my_table.pop("Finn", None))
+    print(my_table.setdefault("Liam", "Carlucci"), my_table.setdefault("Kate", "Cuozzo"))
+    print(sorted(my_table.keys())[:5])
+
+    # An incremental table spreads the work of each resize over the following operations
+    incremental_table = HashTable(incremental=True, rehash_step=2)
+    for i in range(8):
+        incremental_table[f"key{i}"] = i
+    print(incremental_table.stats()["rehashing"], incremental_table["key3"])
+    for i in range(8):
+        incremental_table.get(f"key{i}")
+    print(incremental_table.stats()["rehashing"], len(incremental_table.table))
+
+    # A popped node is kept in the pool and reused by the next add
+    pooled_table = HashTable(pool=NodePool(Node))
+    pooled_table["Liam"] = "Cuozzo"
+    print(pooled_table.pop("Liam"), len(pooled_table.pool))    # Cuozzo 1
+    pooled_table["Pat"] = "Limerick"
+    print(pooled_table["Pat"], len(pooled_table.pool))    # Limerick 0
+
+    # ascii_hash puts anagrams such as Finn and nniF in the same bucket
+    print(ascii_hash("Finn") == ascii_hash("nniF"), fnv1a_hash("Finn") == fnv1a_hash("nniF"))
+    bad_table = HashTable(hasher=ascii_hash)
+    for i in range(100):
+        bad_table[f"key{i}"] = i
+    print(bad_table.stats()["max_chain_length"], my_table.stats()["max_chain_length"])
@@ -3,6 +3,7 @@
 Implements a Min and a Max heap in python
 """
 from abc import ABC, abstractmethod
+from array import array
 import heapq
 
 
@@ -20,6 +21,27 @@ class Heap(ABC):
     def __len__(self) -> int:
         return len(self.items)
 
+    @classmethod
+    def from_iterable(cls, iterable, *args, **kwargs) -> 'Heap':
+        """
+        Builds a heap from every item in the iterable in O(n) time
+        Rather than sifting each item up one at a time, which is O(n log n),
+        all items are placed in the list and then heapify() is called
+        """
+        heap: Heap = cls(*args, **kwargs)
+        heap.items = list(iterable)
+        heap.heapify()
+        return heap
+
+    def heapify(self) -> None:
+        """
+        Restores the heap property over the whole list bottom-up in O(n) time
+        Leaves are already valid heaps, so only the parents need to be sifted down,
+        starting from the last parent and working back to the root
+        """
+        for index in range(self.get_parent_index(len(self.items) - 1), -1, -1):
+            self.sift_down(index)
+
     def add(self, item: int) -> None:
         """
         When adding a value to a heap, the new item is placed at
@@ -53,16 +75,68 @@ class Heap(ABC):
         """
         return self.items[0]
 
+    def push_many(self, iterable) -> None:
+        """
+        Adds every item in the iterable to the heap
+        If more items are added than the heap already holds, it is cheaper
+        to append them all and heapify once than to sift each one up
+        """
+        new_items: list = list(iterable)
+        if len(new_items) > len(self.items):
+            self.items.extend(new_items)
+            self.heapify()
+        else:
+            for item in new_items:
+                self.add(item)
+
+    def pop_many(self, k: int) -> list:
+        """
+        Pops up to k items from the heap in priority order
+        """
+        return [self.pop() for _ in range(min(k, len(self.items)))]
+
+    def pushpop(self, item: int) -> int:
+        """
+        Adds an item and then pops the top of the heap with at most one sift_down
+        If the new item would be the top of the heap it is returned straight away
+        """
+        if self.items and self.has_priority(self.items[0], item):
+            root_val: int = self.items[0]
+            self.items[0] = item
+            self.sift_down()
+            return root_val
+        return item
+
+    def replace(self, item: int) -> int:
+        """
+        Pops the top of the heap and then adds an item with a single sift_down
+        Unlike pushpop(), the returned value is always the old top of the heap
+        """
+        if len(self.items) == 0:
+            raise ValueError("Cannot replace in empty heap")
+        root_val: int = self.items[0]
+        self.items[0] = item
+        self.sift_down()
+        return root_val
+
+    @abstractmethod
+    def has_priority(self, item1: int, item2: int) -> bool:
+        """
+        Returns True if item1 must sit above item2 in the heap
+        """
+
     @abstractmethod
-    def sift_up(self) -> None:
+    def sift_up(self, index: int = None) -> None:
         """
         Used when add() is called
+        Starts from the last element unless an index is given
         """
 
     @abstractmethod
-    def sift_down(self) -> None:
+    def sift_down(self, index: int = 0) -> None:
         """
         Used when pop() is called
+        Starts from the root unless an index is given
         """
 
     # Util Method
@@ -110,28 +184,29 @@ class MinHeap(Heap):
     Implementation of a MinHeap
     """
 
-    def sift_up(self) -> None:
+    def has_priority(self, item1: int, item2: int) -> bool:
+        return item1 < item2
+
+    def sift_up(self, index: int = None) -> None:
         """
         When a MinHeap needs to sift_up after add(),
         1. Start from last element
         1. Swap node with parent while the parent is larger than the node
         """
         # Start with last element
-        index: int = len(self.items) - 1
+        if index is None:
+            index = len(self.items) - 1
         while self.has_parent(index) and self.get_parent(index) > self.items[index]:
             parent_index: int = self.get_parent_index(index)
             self.swap(parent_index, index)
             index = parent_index
 
-    def sift_down(self) -> None:
+    def sift_down(self, index: int = 0) -> None:
         """
         When a MinHeap needs to sift_down after pop(),
-        1. Start from root node
+        1. Start from root node, or the index given by heapify()
         2. Swap node with the smallest child while the node is larger than both children
         """
-        # Start with root element
-        index: int = 0
-
         # We make this the loop as if it no longer has a left child,
         # it will be a leaf node since a heap must be a complete binary tree
         while self.has_left_child(index):
@@ -156,28 +231,29 @@ class MaxHeap(Heap):
     Implementation of a MaxHeap 
     """
 
-    def sift_up(self) -> None:
+    def has_priority(self, item1: int, item2: int) -> bool:
+        return item1 > item2
+
+    def sift_up(self, index: int = None) -> None:
         """
         When a MaxHeap needs to sift_up after add(),
         1. Start from last element
         1. Swap node with parent while the parent is less than the node
         """
         # Start with last element
-        index: int = len(self.items) - 1
+        if index is None:
+            index = len(self.items) - 1
         while self.has_parent(index) and self.get_parent(index) < self.items[index]:
             parent_index: int = self.get_parent_index(index)
             self.swap(parent_index, index)
             index = parent_index
 
-    def sift_down(self) -> None:
+    def sift_down(self, index: int = 0) -> None:
         """
         When a MaxHeap needs to sift_down after pop(),
-        1. Start from root node
+        1. Start from root node, or the index given by heapify()
         2. Swap node with the smallest child while the node is less than both children
         """
-        # Start with root element
-        index: int = 0
-
         # We make this the loop as if it no longer has a left child,
         # it will be a leaf node since a heap must be a complete binary tree
         while self.has_left_child(index):
@@ -198,6 +274,523 @@ class MaxHeap(Heap):
             index = larger_index
 
 
+class DaryHeap(Heap):
+    """
+    An abstract class for heaps where every node has up to `arity` children
+    A higher arity gives a shallower tree, so add() does fewer swaps on the
+    way up at the cost of comparing more children on the way down.
+
+    The child and parent arithmetic is inlined in the sift methods of the
+    subclasses, and a node is moved by sliding its parents or children into a
+    hole rather than swapping, so each step is only a couple of list operations.
+    """
+
+    def __init__(self, arity: int = 4) -> None:
+        super().__init__()
+        if arity < 2:
+            raise ValueError("Arity must be at least 2")
+        self.arity: int = arity
+
+    # The d-ary versions of the index helpers
+    def get_left_child_index(self, parent_index: int) -> int:
+        return (self.arity * parent_index) + 1
+    def get_right_child_index(self, parent_index: int) -> int:
+        return (self.arity * parent_index) + self.arity
+    def get_parent_index(self, index: int) -> int:
+        return (index - 1) // self.arity
+
+
+class DaryMinHeap(DaryHeap):
+    """
+    Implementation of a d-ary MinHeap
+    """
+
+    def has_priority(self, item1: int, item2: int) -> bool:
+        return item1 < item2
+
+    def sift_up(self, index: int = None) -> None:
+        """
+        Slide parents down into the hole while they are larger than the item,
+        then drop the item into the hole
+        """
+        items: list = self.items
+        arity: int = self.arity
+        if index is None:
+            index = len(items) - 1
+        item = items[index]
+
+        while index > 0:
+            parent_index: int = (index - 1) // arity
+            parent = items[parent_index]
+            if not item < parent:
+                break
+            items[index] = parent
+            index = parent_index
+        items[index] = item
+
+    def sift_down(self, index: int = 0) -> None:
+        """
+        Slide the smallest child up into the hole while it is smaller than the item,
+        then drop the item into the hole
+        """
+        items: list = self.items
+        arity: int = self.arity
+        size: int = len(items)
+        if index >= size:
+            return
+        item = items[index]
+
+        while True:
+            first_child_index: int = (arity * index) + 1
+            if first_child_index >= size:
+                break
+
+            # Find the smallest of the up to `arity` children
+            smaller_index: int = first_child_index
+            smaller = items[first_child_index]
+            for child_index in range(first_child_index + 1, min(first_child_index + arity, size)):
+                child = items[child_index]
+                if child < smaller:
+                    smaller_index = child_index
+                    smaller = child
+
+            if not smaller < item:
+                break
+            items[index] = smaller
+            index = smaller_index
+        items[index] = item
+
+
+class DaryMaxHeap(DaryHeap):
+    """
+    Implementation of a d-ary MaxHeap
+    """
+
+    def has_priority(self, item1: int, item2: int) -> bool:
+        return item1 > item2
+
+    def sift_up(self, index: int = None) -> None:
+        """
+        Slide parents down into the hole while they are smaller than the item,
+        then drop the item into the hole
+        """
+        items: list = self.items
+        arity: int = self.arity
+        if index is None:
+            index = len(items) - 1
+        item = items[index]
+
+        while index > 0:
+            parent_index: int = (index - 1) // arity
+            parent = items[parent_index]
+            if not item > parent:
+                break
+            items[index] = parent
+            index = parent_index
+        items[index] = item
+
+    def sift_down(self, index: int = 0) -> None:
+        """
+        Slide the largest child up into the hole while it is larger than the item,
+        then drop the item into the hole
+        """
+        items: list = self.items
+        arity: int = self.arity
+        size: int = len(items)
+        if index >= size:
+            return
+        item = items[index]
+
+        while True:
+            first_child_index: int = (arity * index) + 1
+            if first_child_index >= size:
+                break
+
+            # Find the largest of the up to `arity` children
+            larger_index: int = first_child_index
+            larger = items[first_child_index]
+            for child_index in range(first_child_index + 1, min(first_child_index + arity, size)):
+                child = items[child_index]
+                if child > larger:
+                    larger_index = child_index
+                    larger = child
+
+            if not larger > item:
+                break
+            items[index] = larger
+            index = larger_index
+        items[index] = item
+
+
+class PriorityHeap(Heap):
+    """
+    An abstract class for heaps that keep each priority separate from its item
+    The priorities live in a compact numeric array next to the list of items, so
+    sifting only ever compares machine numbers and never calls an item's __lt__.
+    A priority is either given to add() or computed once with the key function.
+
+    typecode is the array typecode for the priorities, such as "d" for floats or
+    "q" for 64-bit integers
+    """
+
+    def __init__(self, key=None, typecode: str = "d") -> None:
+        super().__init__()
+        self.key = key
+        self.priorities: array = array(typecode)
+
+    @classmethod
+    def from_iterable(cls, iterable, key=None, typecode: str = "d") -> 'PriorityHeap':
+        """
+        Builds a heap from every item in the iterable in O(n) time using the key function
+        """
+        heap: PriorityHeap = cls(key, typecode)
+        heap.items = list(iterable)
+        heap.priorities = array(typecode, map(heap.get_key, heap.items))
+        heap.heapify()
+        return heap
+
+    def get_key(self, item) -> float:
+        """
+        The priority of an item when no priority is given
+        """
+        return item if self.key is None else self.key(item)
+
+    def add(self, item, priority: float = None) -> None:
+        """
+        Places the item and its priority at the end of the heap and sifts them up
+        """
+        self.items.append(item)
+        self.priorities.append(self.get_key(item) if priority is None else priority)
+        self.sift_up()
+
+    def pop(self):
+        """
+        Removes and returns the item with the top priority
+        """
+        if len(self.items) == 0:
+            raise ValueError("Cannot pop from empty heap")
+        root_val = self.items[0]
+
+        # Move the last item and priority into the root position and sift it down
+        self.items[0] = self.items[-1]
+        self.priorities[0] = self.priorities[-1]
+        self.items.pop()
+        self.priorities.pop()
+        self.sift_down()
+
+        return root_val
+
+    def peek_priority(self) -> float:
+        """
+        Get the priority of the top item in the heap
+        """
+        return self.priorities[0]
+
+    def push_many(self, iterable) -> None:
+        """
+        Adds every item in the iterable to the heap using the key function
+        """
+        new_items: list = list(iterable)
+        if len(new_items) > len(self.items):
+            self.items.extend(new_items)
+            self.priorities.extend(map(self.get_key, new_items))
+            self.heapify()
+        else:
+            for item in new_items:
+                self.add(item)
+
+    def pushpop(self, item, priority: float = None):
+        """
+        Adds an item and then pops the top of the heap with at most one sift_down
+        """
+        if priority is None:
+            priority = self.get_key(item)
+        if self.items and self.has_priority(self.priorities[0], priority):
+            root_val = self.items[0]
+            self.items[0] = item
+            self.priorities[0] = priority
+            self.sift_down()
+            return root_val
+        return item
+
+    def replace(self, item, priority: float = None):
+        """
+        Pops the top of the heap and then adds an item with a single sift_down
+        """
+        if len(self.items) == 0:
+            raise ValueError("Cannot replace in empty heap")
+        root_val = self.items[0]
+        self.items[0] = item
+        self.priorities[0] = self.get_key(item) if priority is None else priority
+        self.sift_down()
+        return root_val
+
+    def swap(self, index1: int, index2: int) -> None:
+        """
+        Swaps two items and their priorities
+        """
+        self.items[index1], self.items[index2] = self.items[index2], self.items[index1]
+        self.priorities[index1], self.priorities[index2] = self.priorities[index2], self.priorities[index1]
+
+
+class MinPriorityHeap(PriorityHeap):
+    """
+    Implementation of a MinHeap over separately stored priorities
+    """
+
+    def has_priority(self, item1: float, item2: float) -> bool:
+        return item1 < item2
+
+    def sift_up(self, index: int = None) -> None:
+        """
+        Slide parents down into the hole while their priority is larger,
+        then drop the item and its priority into the hole
+        """
+        items: list = self.items
+        priorities: array = self.priorities
+        if index is None:
+            index = len(items) - 1
+        item = items[index]
+        priority = priorities[index]
+
+        while index > 0:
+            parent_index: int = (index - 1) // 2
+            if not priority < priorities[parent_index]:
+                break
+            items[index] = items[parent_index]
+            priorities[index] = priorities[parent_index]
+            index = parent_index
+        items[index] = item
+        priorities[index] = priority
+
+    def sift_down(self, index: int = 0) -> None:
+        """
+        Slide the child with the smallest priority up into the hole while it is
+        smaller, then drop the item and its priority into the hole
+        """
+        items: list = self.items
+        priorities: array = self.priorities
+        size: int = len(items)
+        if index >= size:
+            return
+        item = items[index]
+        priority = priorities[index]
+
+        while (2 * index) + 1 < size:
+            smaller_index: int = (2 * index) + 1
+            if smaller_index + 1 < size and priorities[smaller_index + 1] < priorities[smaller_index]:
+                smaller_index += 1
+            if not priorities[smaller_index] < priority:
+                break
+            items[index] = items[smaller_index]
+            priorities[index] = priorities[smaller_index]
+            index = smaller_index
+        items[index] = item
+        priorities[index] = priority
+
+
+class MaxPriorityHeap(PriorityHeap):
+    """
+    Implementation of a MaxHeap over separately stored priorities
+    The priorities are compared with > directly, so they never need to be negated
+    """
+
+    def has_priority(self, item1: float, item2: float) -> bool:
+        return item1 > item2
+
+    def sift_up(self, index: int = None) -> None:
+        """
+        Slide parents down into the hole while their priority is smaller,
+        then drop the item and its priority into the hole
+        """
+        items: list = self.items
+        priorities: array = self.priorities
+        if index is None:
+            index = len(items) - 1
+        item = items[index]
+        priority = priorities[index]
+
+        while index > 0:
+            parent_index: int = (index - 1) // 2
+            if not priority > priorities[parent_index]:
+                break
+            items[index] = items[parent_index]
+            priorities[index] = priorities[parent_index]
+            index = parent_index
+        items[index] = item
+        priorities[index] = priority
+
+    def sift_down(self, index: int = 0) -> None:
+        """
+        Slide the child with the largest priority up into the hole while it is
+        larger, then drop the item and its priority into the hole
+        """
+        items: list = self.items
+        priorities: array = self.priorities
+        size: int = len(items)
+        if index >= size:
+            return
+        item = items[index]
+        priority = priorities[index]
+
+        while (2 * index) + 1 < size:
+            larger_index: int = (2 * index) + 1
+            if larger_index + 1 < size and priorities[larger_index + 1] > priorities[larger_index]:
+                larger_index += 1
+            if not priorities[larger_index] > priority:
+                break
+            items[index] = items[larger_index]
+            priorities[index] = priorities[larger_index]
+            index = larger_index
+        items[index] = item
+        priorities[index] = priority
+
+
+class IndexedMinHeap:
+    """
+    Implementation of an indexed (addressable) MinHeap
+    Every item is stored alongside its priority and a position map tracks
+    where each item currently lives in the heap. This allows the priority of an
+    item already in the heap to be changed, or the item to be removed, in O(log n)
+    time instead of pushing duplicates and skipping stale entries when popped.
+
+    Items must be hashable as each item is its own handle into the heap.
+    """
+
+    def __init__(self) -> None:
+        self.items: list = []
+        self.priorities: dict = {}
+        self.positions: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item) -> bool:
+        return item in self.positions
+
+    def contains(self, item) -> bool:
+        """
+        Returns True if the item is currently in the heap
+        """
+        return item in self.positions
+
+    def add(self, item, priority) -> None:
+        """
+        Places the item at the end of the heap and sifts it up into its correct place
+        """
+        if item in self.positions:
+            raise ValueError("Item is already in the heap")
+        self.items.append(item)
+        self.priorities[item] = priority
+        self.positions[item] = len(self.items) - 1
+        self.sift_up(len(self.items) - 1)
+
+    def pop(self):
+        """
+        Removes and returns the item with the smallest priority
+        """
+        if len(self.items) == 0:
+            raise ValueError("Cannot pop from empty heap")
+        root = self.items[0]
+        self.remove(root)
+        return root
+
+    def peek(self):
+        """
+        Get the item with the smallest priority
+        """
+        return self.items[0]
+
+    def get_priority(self, item):
+        """
+        Get the current priority of an item in the heap
+        """
+        return self.priorities[item]
+
+    def decrease_key(self, item, priority) -> None:
+        """
+        Lowers the priority of an item, which can only move it up the heap
+        """
+        if priority > self.priorities[item]:
+            raise ValueError("New priority is larger than the current priority")
+        self.priorities[item] = priority
+        self.sift_up(self.positions[item])
+
+    def increase_key(self, item, priority) -> None:
+        """
+        Raises the priority of an item, which can only move it down the heap
+        """
+        if priority < self.priorities[item]:
+            raise ValueError("New priority is smaller than the current priority")
+        self.priorities[item] = priority
+        self.sift_down(self.positions[item])
+
+    def update(self, item, priority) -> None:
+        """
+        Changes the priority of an item in whichever direction is needed
+        """
+        if priority < self.priorities[item]:
+            self.decrease_key(item, priority)
+        else:
+            self.increase_key(item, priority)
+
+    def remove(self, item) -> None:
+        """
+        Removes an item from anywhere in the heap
+        The last item is moved into the hole and then sifted up or down
+        as its priority could be smaller or larger than the removed item
+        """
+        index: int = self.positions.pop(item)
+        del self.priorities[item]
+        last = self.items.pop()
+        if index == len(self.items):
+            return
+
+        self.items[index] = last
+        self.positions[last] = index
+        self.sift_up(index)
+        self.sift_down(self.positions[last])
+
+    def sift_up(self, index: int) -> None:
+        """
+        Swap node with parent while the parent has a larger priority than the node
+        """
+        while index > 0:
+            parent_index: int = (index - 1) // 2
+            if self.priorities[self.items[parent_index]] <= self.priorities[self.items[index]]:
+                break
+            self.swap(parent_index, index)
+            index = parent_index
+
+    def sift_down(self, index: int) -> None:
+        """
+        Swap node with its smallest child while a child has a smaller priority than the node
+        """
+        size: int = len(self.items)
+        while (2 * index) + 1 < size:
+            smaller_index: int = (2 * index) + 1
+            right_index: int = smaller_index + 1
+            if right_index < size and self.priorities[self.items[right_index]] < self.priorities[self.items[smaller_index]]:
+                smaller_index = right_index
+
+            if self.priorities[self.items[index]] <= self.priorities[self.items[smaller_index]]:
+                break
+
+            self.swap(index, smaller_index)
+            index = smaller_index
+
+    def swap(self, index1: int, index2: int) -> None:
+        """
+        Swaps two items in the heap and keeps the position map in sync
+        """
+        item1 = self.items[index1]
+        item2 = self.items[index2]
+        self.items[index1] = item2
+        self.items[index2] = item1
+        self.positions[item2] = index1
+        self.positions[item1] = index2
+
+
 if __name__ == "__main__":
 
     # Using our heaps
@@ -222,6 +815,41 @@ if __name__ == "__main__":
     # Empty now
     print()
 
+    # Building a heap bottom-up is O(n) rather than n calls to add()
+    bulk_heap = MinHeap.from_iterable(arr)
+    print("Bulk built Min Heap")
+    print(bulk_heap.pop_many(3))
+    print(bulk_heap.pushpop(-10))   # -10 is smaller than the root so it comes straight back
+    print(bulk_heap.replace(100))   # Returns the old root and sifts 100 down
+    print(bulk_heap.pop_many(len(bulk_heap)))
+    print()
+
+    # A 4-ary heap has a shallower tree than a binary heap
+    dary_heap = DaryMinHeap.from_iterable(arr, 4)
+    print("4-ary Min Heap")
+    print(dary_heap.pop_many(len(dary_heap)))
+    print()
+
+    # Priority heaps compare numbers kept next to the items instead of the items themselves
+    words: list[str] = ["pear", "fig", "banana", "kiwi", "apple"]
+    priority_heap = MaxPriorityHeap.from_iterable(words, key=len, typecode="q")
+    priority_heap.add("grape", priority=100)
+    print("Max Priority Heap by word length")
+    print(priority_heap.pop_many(len(priority_heap)))
+    print()
+
+    # Using an indexed heap, the priority of an item can be changed in place
+    indexed_heap = IndexedMinHeap()
+    for index, val in enumerate(arr):
+        indexed_heap.add(f"item{index}", val)
+    indexed_heap.decrease_key("item6", -5)   # 11 -> -5
+    indexed_heap.remove("item3")             # Removes the first 7
+
+    print("Indexed Min Heap")
+    while len(indexed_heap):
+        print(indexed_heap.pop())
+    print()
+
     # Using heapq heaps
     # heapq by default only creates a min heap implementation
     # to use a max heap, invert the values of the integers
@@ -0,0 +1,48 @@
+"""
+Benchmarks the heaps in heap.py against each other and against heapq
+
+Each heap is filled one item at a time with add() and then drained with pop(),
+which is the push heavy pattern of a shortest path frontier
+"""
+import heapq
+import random
+import time
+from heap import MinHeap, DaryMinHeap
+
+NUM_ITEMS: int = 200_000
+
+
+def time_heap(heap, values: list[int]) -> float:
+    """
+    Returns the seconds taken to add every value to the heap and pop them all back off
+    """
+    start: float = time.perf_counter()
+    for val in values:
+        heap.add(val)
+    while len(heap):
+        heap.pop()
+    return time.perf_counter() - start
+
+
+def time_heapq(values: list[int]) -> float:
+    """
+    Returns the seconds taken to push every value onto a heapq list and pop them all back off
+    """
+    start: float = time.perf_counter()
+    heap: list = []
+    for val in values:
+        heapq.heappush(heap, val)
+    while heap:
+        heapq.heappop(heap)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    random_values: list[int] = [random.randint(0, NUM_ITEMS) for _ in range(NUM_ITEMS)]
+
+    print(f"{'heap':<16}{'seconds':>10}")
+    print(f"{'MinHeap':<16}{time_heap(MinHeap(), random_values):>10.3f}")
+    for arity in (2, 4, 8):
+        print(f"{f'DaryMinHeap({arity})':<16}{time_heap(DaryMinHeap(arity), random_values):>10.3f}")
+    print(f"{'heapq':<16}{time_heapq(random_values):>10.3f}")
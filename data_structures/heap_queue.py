@@ -0,0 +1,189 @@
+"""
+Implements blocking priority queues for threads and for asyncio on top of the heaps in heap.py
+The queues wrap any Heap, so the ordering still comes from that heap's sift_up and sift_down.
+A maxsize applies backpressure by making producers wait until consumers make room.
+
+put_many and get_many move a whole batch while holding the lock once, so producers and
+consumers that work in batches do not contend on the lock for every single item.
+"""
+import asyncio
+import threading
+from heap import Heap, MinHeap
+
+
+class ThreadedHeapQueue:
+    """
+    A thread-safe priority queue
+    get() blocks until an item is available and put() blocks while the queue is full.
+    Both raise TimeoutError if the timeout in seconds runs out first, and a timeout of
+    None waits forever. A maxsize of 0 means the queue is unbounded.
+    """
+    def __init__(self, heap: Heap = None, maxsize: int = 0) -> None:
+        self.heap: Heap = heap if heap is not None else MinHeap()
+        self.maxsize: int = maxsize
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.heap)
+
+    def free_slots(self) -> int:
+        """
+        The number of items that can be added before the queue is full
+        The lock must be held by the caller
+        """
+        if self.maxsize <= 0:
+            return float("inf")
+        return self.maxsize - len(self.heap)
+
+    def put(self, item, timeout: float = None) -> None:
+        """
+        Adds an item, waiting for room if the queue is full
+        """
+        with self.not_full:
+            if not self.not_full.wait_for(lambda: self.free_slots() > 0, timeout):
+                raise TimeoutError("Timed out waiting for room in the queue")
+            self.heap.add(item)
+            self.not_empty.notify()
+
+    def get(self, timeout: float = None):
+        """
+        Removes and returns the top item, waiting for one if the queue is empty
+        """
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: len(self.heap) > 0, timeout):
+                raise TimeoutError("Timed out waiting for an item in the queue")
+            item = self.heap.pop()
+            self.not_full.notify()
+            return item
+
+    def put_many(self, items, timeout: float = None) -> None:
+        """
+        Adds every item, taking the lock once for as many items as there is room for
+        """
+        pending: list = list(items)
+        while pending:
+            with self.not_full:
+                if not self.not_full.wait_for(lambda: self.free_slots() > 0, timeout):
+                    raise TimeoutError("Timed out waiting for room in the queue")
+                num_items: int = min(len(pending), self.free_slots())
+                self.heap.push_many(pending[:num_items])
+                self.not_empty.notify(num_items)
+            pending = pending[num_items:]
+
+    def get_many(self, k: int, timeout: float = None) -> list:
+        """
+        Removes and returns up to k top items, waiting until at least one is available
+        """
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: len(self.heap) > 0, timeout):
+                raise TimeoutError("Timed out waiting for an item in the queue")
+            items: list = self.heap.pop_many(k)
+            self.not_full.notify(len(items))
+            return items
+
+
+class AsyncHeapQueue:
+    """
+    An asyncio priority queue
+    get() and put() are coroutines that wait instead of blocking the event loop.
+    Wrap them in asyncio.wait_for() to give up after a timeout.
+    A maxsize of 0 means the queue is unbounded.
+    """
+    def __init__(self, heap: Heap = None, maxsize: int = 0) -> None:
+        self.heap: Heap = heap if heap is not None else MinHeap()
+        self.maxsize: int = maxsize
+        self.lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(self.lock)
+        self.not_full = asyncio.Condition(self.lock)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def free_slots(self) -> int:
+        """
+        The number of items that can be added before the queue is full
+        """
+        if self.maxsize <= 0:
+            return float("inf")
+        return self.maxsize - len(self.heap)
+
+    async def put(self, item) -> None:
+        """
+        Adds an item, waiting for room if the queue is full
+        """
+        async with self.not_full:
+            await self.not_full.wait_for(lambda: self.free_slots() > 0)
+            self.heap.add(item)
+            self.not_empty.notify()
+
+    async def get(self):
+        """
+        Removes and returns the top item, waiting for one if the queue is empty
+        """
+        async with self.not_empty:
+            await self.not_empty.wait_for(lambda: len(self.heap) > 0)
+            item = self.heap.pop()
+            self.not_full.notify()
+            return item
+
+    async def put_many(self, items) -> None:
+        """
+        Adds every item, taking the lock once for as many items as there is room for
+        """
+        pending: list = list(items)
+        while pending:
+            async with self.not_full:
+                await self.not_full.wait_for(lambda: self.free_slots() > 0)
+                num_items: int = min(len(pending), self.free_slots())
+                self.heap.push_many(pending[:num_items])
+                self.not_empty.notify(num_items)
+            pending = pending[num_items:]
+
+    async def get_many(self, k: int) -> list:
+        """
+        Removes and returns up to k top items, waiting until at least one is available
+        """
+        async with self.not_empty:
+            await self.not_empty.wait_for(lambda: len(self.heap) > 0)
+            items: list = self.heap.pop_many(k)
+            self.not_full.notify(len(items))
+            return items
+
+
+if __name__ == "__main__":
+    # Two producer threads feed a bounded queue that one consumer drains
+    threaded_queue = ThreadedHeapQueue(maxsize=4)
+    producers: list[threading.Thread] = [
+        threading.Thread(target=threaded_queue.put_many, args=(range(start, 20, 2),))
+        for start in (0, 1)
+    ]
+    for producer in producers:
+        producer.start()
+
+    consumed: list[int] = []
+    while len(consumed) < 20:
+        consumed.extend(threaded_queue.get_many(4, timeout=1))
+    for producer in producers:
+        producer.join()
+    print(sorted(consumed) == list(range(20)))     # True
+
+    try:
+        threaded_queue.get(timeout=0.01)
+    except TimeoutError as error:
+        print(error)
+
+    async def main() -> None:
+        async_queue = AsyncHeapQueue()
+
+        # The consumer waits on the event loop until the producer puts an item
+        consumer_task = asyncio.create_task(async_queue.get())
+        await async_queue.put(3)
+        print(await consumer_task)      # 3
+
+        await async_queue.put_many([5, 2, -1, 7])
+        print(await async_queue.get_many(4))    # [-1, 2, 5, 7]
+
+    asyncio.run(main())
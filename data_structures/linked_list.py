@@ -1,10 +1,13 @@
 """
 Implements a Singly Linked List and a Doubly Linked List.
 A linked list is a series of linearly connected pointers that hold values.
+
+Nodes use __slots__ instead of a per-instance __dict__, which makes each one much smaller.
+A NodePool can be given to a list to recycle removed nodes instead of allocating new ones.
 """
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Node[T]:
     """
     A pointer to hold a value and the next and previous pointers of
@@ -14,14 +17,77 @@ class Node[T]:
     next: 'Node' = None
     prev: 'Node' = None
 
+class NodePool:
+    """
+    A free list of released nodes of a single node type
+    acquire() reuses a released node if there is one, calling __init__ on it again,
+    and only allocates a new node when the pool is empty.
+    The free nodes are chained through their next pointers, so the pool itself allocates nothing.
+    At most max_size nodes are kept, any more released nodes are left to the garbage collector.
+    """
+    def __init__(self, node_type: type = Node, max_size: int = None) -> None:
+        self.node_type: type = node_type
+        self.max_size: int = max_size
+        self.free: Node = None
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def acquire(self, *args):
+        """
+        Returns a node initialised with args, recycled from the pool if possible
+        """
+        node = self.free
+        if node is None:
+            return self.node_type(*args)
+        self.free = node.next
+        self.size -= 1
+        node.__init__(*args)
+        return node
+
+    def check_node_type(self, node_type: type) -> None:
+        """
+        Raises a ValueError if the pool does not hold nodes of node_type
+        A list must check the pool it is given, as acquire() passes its arguments
+        straight to the node type's __init__
+        """
+        if self.node_type is not node_type:
+            raise ValueError(
+                f"The pool holds {self.node_type.__module__}.{self.node_type.__qualname__} nodes, "
+                f"not {node_type.__module__}.{node_type.__qualname__} nodes"
+            )
+
+    def release(self, node) -> None:
+        """
+        Returns a node that is no longer linked into any list to the pool
+        Every field is cleared so the pool doesn't keep old values alive
+        """
+        if self.max_size is not None and self.size >= self.max_size:
+            return
+        for name in self.node_type.__slots__:
+            setattr(node, name, None)
+        node.next = self.free
+        self.free = node
+        self.size += 1
+
 class SLL:
     """
     A Singularly Linked List where only the next pointer in the Node
     class is used and tracked
     """
-    def __init__(self, head: Node):
+    def __init__(self, head: Node, pool: NodePool = None):
+        if pool is not None:
+            pool.check_node_type(Node)
         self.head: Node = head
         self.tail: Node = head
+        self.pool: NodePool = pool
+
+    def new_node(self, val) -> Node:
+        """
+        Returns a Node holding val, taken from the pool if there is one
+        """
+        return self.pool.acquire(val) if self.pool is not None else Node(val)
 
     def add(self, node: Node):
         """
@@ -30,6 +96,33 @@ class SLL:
         self.tail.next = node
         self.tail = node
 
+    def append(self, val) -> None:
+        """
+        Adds a new node holding val to the end of the SLL
+        """
+        node: Node = self.new_node(val)
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+
+    def pop_head(self):
+        """
+        Removes the head node and returns its value, or None if the SLL is empty
+        The node is released to the pool if there is one
+        """
+        node: Node = self.head
+        if not node:
+            return None
+        self.head = node.next
+        if self.tail is node:
+            self.tail = None
+        val = node.val
+        if self.pool is not None:
+            self.pool.release(node)
+        return val
+
     def print(self):
         """
         Prints the whole list from head to end
@@ -43,9 +136,12 @@ class DLL:
     """
     A Doubly Linked List where each Node tracks its next and prev Nodes
     """
-    def __init__(self, head: Node) -> None:
+    def __init__(self, head: Node, pool: NodePool = None) -> None:
+        if pool is not None:
+            pool.check_node_type(Node)
         self.head = head    # The first node in the list
         self.tail = head    # The last node in the list
+        self.pool = pool
 
     def add(self, node: Node) -> None:
         """
@@ -55,6 +151,37 @@ class DLL:
         self.tail.next = node
         self.tail = node
 
+    def append(self, val) -> Node:
+        """
+        Adds a new node holding val to the end of the DLL and returns it
+        The node is taken from the pool if there is one
+        """
+        node: Node = self.pool.acquire(val) if self.pool is not None else Node(val)
+        if self.tail:
+            self.add(node)
+        else:
+            self.head = node
+            self.tail = node
+        return node
+
+    def remove(self, node: Node):
+        """
+        Unlinks a node from the DLL and returns its value
+        The node is released to the pool if there is one
+        """
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        val = node.val
+        if self.pool is not None:
+            self.pool.release(node)
+        return val
+
     @staticmethod
     def add_after(node: Node, new_node: Node) -> None:
         """
@@ -110,3 +237,13 @@ if __name__ == "__main__":
     dll.add(Node(300))
     # 100 <-> 200 <-> 300
     dll.print()
+    print()
+
+    # Removed nodes go back to the pool and are reused by the next append
+    pool = NodePool()
+    pooled_dll = DLL(None, pool)
+    first: Node = pooled_dll.append(1)
+    pooled_dll.append(2)
+    pooled_dll.remove(first)
+    print(len(pool), pooled_dll.append(3) is first, len(pool))     # 1 True 0
+    pooled_dll.print()
@@ -0,0 +1,121 @@
+"""
+Benchmarks the memory used by linked list nodes, and the cost of recycling them through a NodePool
+
+Memory is measured with tracemalloc as the bytes allocated while building a structure,
+divided by the number of elements. The "before" rows use plain dataclass nodes with a
+__dict__, which is how Node and the hash table Node used to be declared.
+
+The churn benchmark repeatedly fills a Stack and empties it again, which is the pattern
+of a DFS frontier, with and without a pool.
+"""
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+from hash_table import HashTable
+from linked_list import Node, NodePool, SLL
+from stack import Stack
+
+NUM_ITEMS: int = 100_000
+NUM_ROUNDS: int = 20
+
+
+@dataclass
+class DictNode:
+    """
+    A linked list Node without __slots__
+    """
+    val: object
+    next: 'DictNode' = None
+    prev: 'DictNode' = None
+
+
+@dataclass
+class DictHashNode:
+    """
+    A hash table Node without __slots__
+    """
+    key: str
+    val: object
+    next: 'DictHashNode' = None
+    prev: 'DictHashNode' = None
+
+
+class DictNodeHashTable(HashTable):
+    """
+    A HashTable that stores its entries in DictHashNodes
+    """
+    def new_node(self, key: str, val) -> DictHashNode:
+        return DictHashNode(key, val)
+
+
+def bytes_per_item(build: Callable[[], object]) -> float:
+    """
+    Returns the bytes allocated by build() per item it stores
+    The result of build() is kept alive until the measurement is taken
+    """
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    built = build()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return (end - start) / NUM_ITEMS
+
+
+def build_sll(node_type: type) -> SLL:
+    """
+    Builds an SLL of NUM_ITEMS nodes of node_type
+    """
+    sll: SLL = SLL(node_type(0))
+    for i in range(1, NUM_ITEMS):
+        sll.add(node_type(i))
+    return sll
+
+
+def table_bytes_per_item(table_type: type) -> float:
+    """
+    Returns the bytes allocated per entry while adding NUM_ITEMS entries to a hash table
+    The keys and the bucket array are made first so only the nodes are counted
+    """
+    keys: list[str] = [f"key{i}" for i in range(NUM_ITEMS)]
+    table: HashTable = table_type(size=NUM_ITEMS * 2)
+
+    def build() -> HashTable:
+        for key in keys:
+            table[key] = None
+        return table
+    return bytes_per_item(build)
+
+
+def time_churn(pool: NodePool) -> tuple[float, int]:
+    """
+    Returns the seconds taken to fill and empty a Stack NUM_ROUNDS times
+    and the number of garbage collections that ran meanwhile
+    """
+    stack: Stack = Stack(pool)
+    collections_before: int = sum(stat["collections"] for stat in gc.get_stats())
+    start: float = time.perf_counter()
+    for _ in range(NUM_ROUNDS):
+        for i in range(NUM_ITEMS):
+            stack.push(i)
+        for _ in range(NUM_ITEMS):
+            stack.pop()
+    seconds: float = time.perf_counter() - start
+    return seconds, sum(stat["collections"] for stat in gc.get_stats()) - collections_before
+
+
+if __name__ == "__main__":
+    print(f"{'nodes':<28}{'bytes/item':>12}")
+    print(f"{'SLL before (__dict__)':<28}{bytes_per_item(lambda: build_sll(DictNode)):>12.1f}")
+    print(f"{'SLL after (__slots__)':<28}{bytes_per_item(lambda: build_sll(Node)):>12.1f}")
+    print(f"{'HashTable before (__dict__)':<28}{table_bytes_per_item(DictNodeHashTable):>12.1f}")
+    print(f"{'HashTable after (__slots__)':<28}{table_bytes_per_item(HashTable):>12.1f}")
+    print()
+
+    print(f"{'stack churn':<28}{'seconds':>12}{'gc runs':>10}")
+    for name, pool in (("no pool", None), ("NodePool", NodePool())):
+        seconds, collections = time_churn(pool)
+        print(f"{name:<28}{seconds:>12.3f}{collections:>10}")
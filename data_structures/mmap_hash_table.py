@@ -0,0 +1,168 @@
+"""
+Implements a persistent read-only string hash table stored in a single file
+write_table() lays the entries of a HashTable out in a fixed binary format, and
+MmapHashTable maps that file with mmap and looks keys up directly in the mapped bytes.
+Opening the file does not deserialize anything, pages are only read in when a lookup
+touches them, and every process that maps the same file shares the same pages.
+
+File layout, every integer is little-endian
+    Header:             magic, number of buckets, number of entries
+    Bucket directory:   for each bucket, the index of its first slot and its number of slots
+    Slots:              for each entry, its hash, the offset of its key in the string heap,
+                        the key length and the value length. The value follows the key.
+    String heap:        the UTF-8 bytes of every key and value
+
+The slots of a bucket are stored next to each other, so a lookup reads one directory entry
+and then scans a short run of fixed-width slots.
+Hashes use fnv1a_hash, which unlike the builtin hash is the same in every process.
+
+get:    O(1) average time
+Space:  O(n) on disk, O(1) in memory
+"""
+import mmap
+import os
+import struct
+import tempfile
+from hash_table import HashTable, fnv1a_hash
+
+MAGIC: bytes = b"DSAHASH1"
+HEADER = struct.Struct("<8sQQ")
+BUCKET = struct.Struct("<II")
+SLOT = struct.Struct("<QQII")
+MAX_LOAD_FACTOR: float = 0.75
+
+
+def write_table(table, path: str) -> None:
+    """
+    Writes every key and value of the table to the file at path
+    table can be anything with an items() method, such as a HashTable or a dict,
+    and its keys and values must be strings
+    """
+    entries: list[tuple[int, bytes, bytes]] = []
+    for key, val in table.items():
+        if not isinstance(key, str) or not isinstance(val, str):
+            raise TypeError("Only string keys and values can be written")
+        entries.append((fnv1a_hash(key), key.encode(), val.encode()))
+
+    num_buckets: int = 1
+    while num_buckets * MAX_LOAD_FACTOR < len(entries):
+        num_buckets *= 2
+
+    # Group the entries by bucket so each bucket's slots are contiguous
+    entries.sort(key=lambda entry: entry[0] & (num_buckets - 1))
+    heap_start: int = HEADER.size + (num_buckets * BUCKET.size) + (len(entries) * SLOT.size)
+
+    directory: bytearray = bytearray(num_buckets * BUCKET.size)
+    slots: bytearray = bytearray(len(entries) * SLOT.size)
+    string_heap: bytearray = bytearray()
+    bucket_counts: list[int] = [0] * num_buckets
+    bucket_starts: list[int] = [0] * num_buckets
+
+    for index, (hash_val, key, val) in enumerate(entries):
+        bucket: int = hash_val & (num_buckets - 1)
+        if bucket_counts[bucket] == 0:
+            bucket_starts[bucket] = index
+        bucket_counts[bucket] += 1
+
+        SLOT.pack_into(slots, index * SLOT.size, hash_val, heap_start + len(string_heap), len(key), len(val))
+        string_heap += key
+        string_heap += val
+
+    for bucket in range(num_buckets):
+        BUCKET.pack_into(directory, bucket * BUCKET.size, bucket_starts[bucket], bucket_counts[bucket])
+
+    with open(path, "wb") as table_file:
+        table_file.write(HEADER.pack(MAGIC, num_buckets, len(entries)))
+        table_file.write(directory)
+        table_file.write(slots)
+        table_file.write(string_heap)
+
+
+class MmapHashTable:
+    """
+    The MmapHashTable class that looks string keys up in a file written by write_table()
+    It has the same get/__getitem__ interface as HashTable but cannot be changed.
+    Use it as a context manager, or call close(), to unmap the file.
+    """
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as table_file:
+            self.mmap = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.num_buckets, self.count = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            self.mmap.close()
+            raise ValueError(f"{path} is not a hash table file")
+        self.slots_start: int = HEADER.size + (self.num_buckets * BUCKET.size)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> 'MmapHashTable':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def find(self, key: str) -> int:
+        """
+        Returns the index of the key's slot, or -1 if the key is not in the table
+        """
+        hash_val: int = fnv1a_hash(key)
+        key_bytes: bytes = key.encode()
+        first_slot, num_slots = BUCKET.unpack_from(self.mmap, HEADER.size + ((hash_val & (self.num_buckets - 1)) * BUCKET.size))
+
+        for slot in range(first_slot, first_slot + num_slots):
+            slot_hash, key_offset, key_len, _ = SLOT.unpack_from(self.mmap, self.slots_start + (slot * SLOT.size))
+            if slot_hash == hash_val and self.mmap[key_offset:key_offset + key_len] == key_bytes:
+                return slot
+        return -1
+
+    def get(self, key: str) -> str:
+        """
+        Return a value from the hash table given the key
+        """
+        slot: int = self.find(key)
+        if slot == -1:
+            return None
+        _, key_offset, key_len, val_len = SLOT.unpack_from(self.mmap, self.slots_start + (slot * SLOT.size))
+        val_offset: int = key_offset + key_len
+        return self.mmap[val_offset:val_offset + val_len].decode()
+
+    def __getitem__(self, key: str) -> str:
+        return self.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) != -1
+
+    def items(self):
+        """
+        Yields every key and value pair in bucket order
+        """
+        for slot in range(self.count):
+            _, key_offset, key_len, val_len = SLOT.unpack_from(self.mmap, self.slots_start + (slot * SLOT.size))
+            val_offset: int = key_offset + key_len
+            yield self.mmap[key_offset:val_offset].decode(), self.mmap[val_offset:val_offset + val_len].decode()
+
+    def close(self) -> None:
+        """
+        Unmaps the file
+        """
+        self.mmap.close()
+
+
+if __name__ == "__main__":
+    my_table = HashTable()
+    names = [("Liam", "Cuozzo"), ("Pat", "Limerick"), ("Mike", "Carlucci")]
+    for name in names:
+        my_table.add(*name)
+    for i in range(100):
+        my_table[f"key{i}"] = str(i)
+
+    with tempfile.TemporaryDirectory() as table_directory:
+        table_path: str = os.path.join(table_directory, "names.table")
+        write_table(my_table, table_path)
+
+        # Reopening the file only maps it, nothing is rebuilt
+        with MmapHashTable(table_path) as mapped_table:
+            print(len(mapped_table), mapped_table["Pat"], mapped_table["key42"])    # 103 Limerick 42
+            print("Finn" in mapped_table, mapped_table["Finn"])     # False None
@@ -0,0 +1,210 @@
+"""
+Implements a min Pairing Heap in python
+A pairing heap is a tree where every node can have any number of children and
+each node is smaller than all of its children. Two heaps are melded by making the
+root with the larger value the first child of the other root, which is O(1).
+
+add:            O(1) time
+meld:           O(1) time
+peek:           O(1) time
+pop:            O(log n) amortized time
+decrease_key:   O(log n) amortized time
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class PairingNode[T]:
+    """
+    A node in the pairing heap
+    The children of a node are a linked list that starts at child and follows sibling.
+    prev points at the parent for the first child and at the left sibling otherwise.
+    """
+    val: T
+    child: 'PairingNode' = None
+    sibling: 'PairingNode' = None
+    prev: 'PairingNode' = None
+
+
+class PairingHeap[T]:
+    """
+    The PairingHeap class
+    It has the same add/pop/peek/__len__ interface as the list based heaps in heap.py,
+    and add() returns the node so it can be passed to decrease_key() later
+    """
+    def __init__(self) -> None:
+        self.root: PairingNode = None
+        self.size: int = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_iterable(cls, iterable) -> 'PairingHeap':
+        """
+        Builds a heap from every item in the iterable in O(n) time
+        """
+        heap: PairingHeap = cls()
+        heap.push_many(iterable)
+        return heap
+
+    def add(self, item: T) -> PairingNode:
+        """
+        Adds the item as a single node heap melded with the root
+        """
+        node: PairingNode = PairingNode(item)
+        self.root = node if self.root is None else self.link(self.root, node)
+        self.size += 1
+        return node
+
+    def push_many(self, iterable) -> None:
+        """
+        Adds every item in the iterable to the heap
+        """
+        for item in iterable:
+            self.add(item)
+
+    def peek(self) -> T:
+        """
+        Get the smallest value of the heap
+        """
+        if self.root is None:
+            raise ValueError("Cannot peek an empty heap")
+        return self.root.val
+
+    def pop(self) -> T:
+        """
+        Removes the root and pairs up its children into the new root
+        """
+        if self.root is None:
+            raise ValueError("Cannot pop from empty heap")
+        old_root: PairingNode = self.root
+        self.root = self.merge_pairs(old_root.child)
+        self.size -= 1
+
+        old_root.child = None
+        return old_root.val
+
+    def pop_many(self, k: int) -> list[T]:
+        """
+        Pops up to k items from the heap in sorted order
+        """
+        return [self.pop() for _ in range(min(k, self.size))]
+
+    def pushpop(self, item: T) -> T:
+        """
+        Adds an item and then pops the smallest value of the heap
+        """
+        if self.root is not None and self.root.val < item:
+            root_val: T = self.pop()
+            self.add(item)
+            return root_val
+        return item
+
+    def replace(self, item: T) -> T:
+        """
+        Pops the smallest value of the heap and then adds an item
+        """
+        root_val: T = self.pop()
+        self.add(item)
+        return root_val
+
+    def meld(self, other: 'PairingHeap') -> None:
+        """
+        Moves every item of the other heap into this heap in O(1) time
+        The other heap is left empty
+        """
+        if other.root is not None:
+            self.root = other.root if self.root is None else self.link(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+    def decrease_key(self, node: PairingNode, item: T) -> None:
+        """
+        Lowers the value of a node that was returned by add()
+        The node's subtree is cut away from its parent and melded with the root
+        """
+        if node.val < item:
+            raise ValueError("New value is larger than the current value")
+        node.val = item
+        if node is self.root:
+            return
+
+        # Unlink the node from its parent or left sibling
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.prev = None
+        node.sibling = None
+
+        self.root = self.link(self.root, node)
+
+    @staticmethod
+    def link(first: PairingNode, second: PairingNode) -> PairingNode:
+        """
+        Melds two heap roots by making the larger root the first child of the smaller
+        Returns the new root
+        """
+        if second.val < first.val:
+            first, second = second, first
+
+        second.prev = first
+        second.sibling = first.child
+        if first.child:
+            first.child.prev = second
+        first.child = second
+
+        return first
+
+    def merge_pairs(self, first: PairingNode) -> PairingNode:
+        """
+        The two pass pairing done after a pop
+        1. Link the children in pairs from left to right
+        2. Link the pairs together from right to left
+        This is done iteratively as a node can have O(n) children
+        """
+        if first is None:
+            return None
+
+        pairs: list[PairingNode] = []
+        node: PairingNode = first
+        while node:
+            second: PairingNode = node.sibling
+            next_node: PairingNode = second.sibling if second else None
+
+            node.prev = None
+            node.sibling = None
+            if second:
+                second.prev = None
+                second.sibling = None
+                pairs.append(self.link(node, second))
+            else:
+                pairs.append(node)
+            node = next_node
+
+        root: PairingNode = pairs.pop()
+        while pairs:
+            root = self.link(pairs.pop(), root)
+        root.prev = None
+        return root
+
+
+if __name__ == "__main__":
+    shard1 = PairingHeap.from_iterable([5, 2, -1, 7])
+    shard2 = PairingHeap()
+    node_eleven: PairingNode = shard2.add(11)
+    shard2.push_many([7, 0])
+
+    # Lower 11 to -5 before merging the shards
+    shard2.decrease_key(node_eleven, -5)
+
+    # Merging the shards is O(1) no matter how large they are
+    shard1.meld(shard2)
+    print(len(shard1), len(shard2))     # 7 0
+
+    while len(shard1):
+        print(shard1.pop())             # -5 -1 0 2 5 7 7
@@ -1,48 +1,120 @@
 """
-Implements a FIFO Queue data structure using a Doubly Linked List
+Implements a FIFO Queue data structure using a ring buffer
+The values live in a list whose length is always a power of two. head is the index of the
+front value and count is how many values there are, so the back of the queue is at
+(head + count) & mask and both ends wrap around the end of the list.
+When the buffer is full it doubles, unwrapping the values so the front is at index 0 again.
+
+enqueue:    O(1) amortized time
+dequeue:    O(1) time
+Space:      O(n)
 """
 from typing import TypeVar
-from linked_list import Node, DLL
 
 T = TypeVar('T')
+CAPACITY: int = 8
 
 class Queue[T]:
     """
     The Queue class
-    We places all new values at the back of the DLL and remove new values
-    from the head of the DLL
+    We place all new values at the back of the ring buffer and remove values
+    from the front of it
     """
-    def __init__(self) -> None:
-        self.dll = DLL(None)
+    def __init__(self, capacity: int = CAPACITY) -> None:
+        size: int = 1
+        while size < capacity:
+            size *= 2
+        self.buffer: list = [None] * size
+        self.mask: int = size - 1
+        self.head: int = 0
+        self.count: int = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def grow(self, min_size: int) -> None:
+        """
+        Doubles the buffer until it can hold min_size values
+        """
+        size: int = len(self.buffer)
+        while size < min_size:
+            size *= 2
+        self.buffer = list(self) + ([None] * (size - self.count))
+        self.mask = size - 1
+        self.head = 0
 
     def enqueue(self, val: T) -> None:
         """
-        Add a value to the front of the queue
+        Add a value to the back of the queue
         """
-        if self.dll.head:
-            self.dll.add(Node(val))
-        else:
-            self.dll.head = Node(val)
-            self.dll.tail = self.dll.head
+        if self.count == len(self.buffer):
+            self.grow(self.count + 1)
+        self.buffer[(self.head + self.count) & self.mask] = val
+        self.count += 1
+
+    def enqueue_many(self, vals) -> None:
+        """
+        Add every value to the back of the queue in order, growing the buffer at most once
+        """
+        vals = list(vals)
+        if self.count + len(vals) > len(self.buffer):
+            self.grow(self.count + len(vals))
+
+        # Copy in at most two slices, up to the end of the buffer and then from its start
+        size: int = len(self.buffer)
+        tail: int = (self.head + self.count) & self.mask
+        first: int = min(len(vals), size - tail)
+        self.buffer[tail:tail + first] = vals[:first]
+        self.buffer[:len(vals) - first] = vals[first:]
+        self.count += len(vals)
 
     def dequeue(self) -> T:
         """
         Removes a value from the front of the queue
         """
         # If the queue is empty, return None
-        if not self.dll.head:
+        if not self.count:
             return None
 
-        # Remove the head node and return it
-        old_head: Node = self.dll.head
-        if old_head.next:
-            new_head: Node = old_head.next
-            new_head.prev = None
-            self.dll.head = new_head
-        else:
-            self.dll.head = None
+        val: T = self.buffer[self.head]
+        self.buffer[self.head] = None   # Don't keep the value alive
+        self.head = (self.head + 1) & self.mask
+        self.count -= 1
+        return val
 
-        return old_head.val
+    def dequeue_many(self, k: int) -> list[T]:
+        """
+        Removes up to k values from the front of the queue and returns them in order
+        """
+        k = max(0, min(k, self.count))
+        size: int = len(self.buffer)
+        first: int = min(k, size - self.head)
+        vals: list[T] = self.buffer[self.head:self.head + first] + self.buffer[:k - first]
+        self.buffer[self.head:self.head + first] = [None] * first
+        self.buffer[:k - first] = [None] * (k - first)
+        self.head = (self.head + k) & self.mask
+        self.count -= k
+        return vals
+
+    def peek(self) -> T:
+        """
+        Returns the value at the front of the queue without removing it, or None if it is empty
+        """
+        return self.buffer[self.head] if self.count else None
+
+    def __iter__(self):
+        """
+        Yields every value from front to back
+        """
+        for i in range(self.count):
+            yield self.buffer[(self.head + i) & self.mask]
+
+    def print(self) -> None:
+        """
+        Prints the whole queue from front to back
+        """
+        for val in self:
+            print(val)
 
 if __name__ == "__main__":
     myqueue = Queue()
@@ -50,11 +122,14 @@ if __name__ == "__main__":
     myqueue.enqueue("Liam")
     myqueue.enqueue("Pat")
     myqueue.enqueue("Mike")
-    myqueue.dll.print()
+    myqueue.print()
     print()
 
     print(myqueue.dequeue())
     print(myqueue.dequeue())
     print(myqueue.dequeue())
     print(myqueue.dequeue())
-    myqueue.dll.print()
+    myqueue.print()
+
+    myqueue.enqueue_many(range(20))
+    print(len(myqueue), myqueue.peek(), myqueue.dequeue_many(5))   # 20 0 [0, 1, 2, 3, 4]
@@ -0,0 +1,232 @@
+"""
+Implements an open addressing string hash table with Robin Hood probing
+Instead of a linked list per bucket, every entry lives directly in flat parallel arrays of
+cached hashes, keys and values. A collision probes the following slots in order.
+
+Robin Hood probing: while inserting, if the new entry is further from its home slot than the
+entry already in a slot, they swap places and the displaced entry keeps probing. This keeps
+every probe sequence short and lets a lookup stop as soon as it passes an entry that is
+closer to home than it would be.
+
+Deleting shifts the following entries back one slot instead of leaving a tombstone, so
+lookups never have to skip over deleted slots.
+
+add/get/delete: O(1) average time
+Space:          O(n), three machine words per slot and no Node objects
+"""
+from array import array
+from collections import Counter
+from typing import Callable, TypeVar
+
+T = TypeVar('T')
+TABLE_SIZE: int = 16
+MAX_LOAD_FACTOR: float = 0.85
+EMPTY: int = -1
+HASH_MASK: int = (1 << 63) - 1
+
+
+class RobinHoodHashTable[str, T]:
+    """
+    The RobinHoodHashTable class that maps a string key to any value val
+    It has the same add/get/__getitem__/__setitem__ interface as HashTable
+    The number of slots is always a power of two so a hash maps to a slot with a mask
+    Any hasher that maps a string to an int can be given, as with HashTable
+    """
+    def __init__(self, size: int = TABLE_SIZE, max_load_factor: float = MAX_LOAD_FACTOR,
+                 hasher: Callable[[str], int] = hash):
+        # A full table has no empty slot to end a probe, so it must always keep one free
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        self.hasher: Callable[[str], int] = hasher
+        capacity: int = 1
+        while capacity < size:
+            capacity *= 2
+        self.max_load_factor: float = max_load_factor
+        self.count: int = 0
+        self.allocate(capacity)
+
+    def allocate(self, capacity: int) -> None:
+        """
+        Creates empty slot arrays with the given capacity
+        """
+        self.mask: int = capacity - 1
+        # A hash of EMPTY marks an empty slot, real hashes are masked to be non-negative
+        self.hashes: array = array("q", [EMPTY]) * capacity
+        self.keys: list = [None] * capacity
+        self.vals: list = [None] * capacity
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, key: str, val: T) -> None:
+        """
+        Add a value into the hash table given the key, replacing the value if the key exists
+        The table only grows when a new entry needs an empty slot, so replacing a value never resizes
+        """
+        hash_val: int = self.hasher(key) & HASH_MASK
+        mask: int = self.mask
+        hashes: array = self.hashes
+        keys: list = self.keys
+        vals: list = self.vals
+
+        index: int = hash_val & mask
+        distance: int = 0
+        while True:
+            slot_hash: int = hashes[index]
+            if slot_hash == EMPTY:
+                if self.count + 1 > (mask + 1) * self.max_load_factor:
+                    # Every entry but the one we are carrying is in the table, so grow and place it
+                    self.resize((mask + 1) * 2)
+                    self.add(key, val)
+                    return
+                hashes[index] = hash_val
+                keys[index] = key
+                vals[index] = val
+                self.count += 1
+                return
+
+            if slot_hash == hash_val and keys[index] == key:
+                vals[index] = val
+                return
+
+            # Take the slot from an entry that is closer to its home than we are
+            slot_distance: int = (index - slot_hash) & mask
+            if slot_distance < distance:
+                hashes[index], hash_val = hash_val, slot_hash
+                keys[index], key = key, keys[index]
+                vals[index], val = val, vals[index]
+                distance = slot_distance
+
+            index = (index + 1) & mask
+            distance += 1
+
+    def __setitem__(self, key: str, val) -> None:
+        self.add(key, val)
+
+    def find(self, key: str) -> int:
+        """
+        Returns the slot holding the key or -1 if it is not in the table
+        """
+        hash_val: int = self.hasher(key) & HASH_MASK
+        mask: int = self.mask
+        hashes: array = self.hashes
+
+        index: int = hash_val & mask
+        distance: int = 0
+        while True:
+            slot_hash: int = hashes[index]
+            # Once we reach an entry closer to home than we are, the key cannot be further on
+            if slot_hash == EMPTY or ((index - slot_hash) & mask) < distance:
+                return -1
+            if slot_hash == hash_val and self.keys[index] == key:
+                return index
+            index = (index + 1) & mask
+            distance += 1
+
+    def get(self, key: str) -> T:
+        """
+        Return a value from the hash table given the key
+        """
+        index: int = self.find(key)
+        return None if index == -1 else self.vals[index]
+
+    def __getitem__(self, key: str) -> T:
+        return self.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.find(key) != -1
+
+    def delete(self, key: str) -> T:
+        """
+        Removes the key from the hash table and returns its value
+        The entries after it are shifted back one slot until one is already in its home slot
+        """
+        index: int = self.find(key)
+        if index == -1:
+            raise KeyError(key)
+        val: T = self.vals[index]
+
+        mask: int = self.mask
+        hashes: array = self.hashes
+        next_index: int = (index + 1) & mask
+        while hashes[next_index] != EMPTY and ((next_index - hashes[next_index]) & mask) > 0:
+            hashes[index] = hashes[next_index]
+            self.keys[index] = self.keys[next_index]
+            self.vals[index] = self.vals[next_index]
+            index = next_index
+            next_index = (next_index + 1) & mask
+
+        hashes[index] = EMPTY
+        self.keys[index] = None
+        self.vals[index] = None
+        self.count -= 1
+        return val
+
+    def __delitem__(self, key: str) -> None:
+        self.delete(key)
+
+    def items(self):
+        """
+        Yields every key and value pair in slot order
+        """
+        for index, slot_hash in enumerate(self.hashes):
+            if slot_hash != EMPTY:
+                yield self.keys[index], self.vals[index]
+
+    def resize(self, capacity: int) -> None:
+        """
+        Reinserts every entry into slot arrays of the new capacity
+        """
+        old_items: list = list(self.items())
+        self.count = 0
+        self.allocate(capacity)
+        for key, val in old_items:
+            self.add(key, val)
+
+    def stats(self) -> dict:
+        """
+        Reports how far entries sit from their home slot
+        A lookup for a key probes its distance + 1 slots
+        """
+        distances: Counter = Counter(
+            (index - slot_hash) & self.mask
+            for index, slot_hash in enumerate(self.hashes) if slot_hash != EMPTY
+        )
+        return {
+            "slots": self.mask + 1,
+            "entries": self.count,
+            "load_factor": self.count / (self.mask + 1),
+            "probe_distances": dict(sorted(distances.items())),
+            "max_probe_distance": max(distances, default=0),
+            "average_probes": (sum(d * n for d, n in distances.items()) / self.count) + 1 if self.count else 0.0,
+        }
+
+    def print(self):
+        """
+        Prints the hash table
+        """
+        for key, val in self.items():
+            print(f"Key={key}, Val={val}")
+
+
+if __name__ == "__main__":
+    my_table = RobinHoodHashTable()
+
+    names = [("Liam", "Cuozzo"), ("Pat", "Limerick"), ("Mike", "Carlucci")]
+    for name in names:
+        my_table.add(*name)
+    my_table.print()
+    print()
+
+    my_table["Finn"] = "Cuozzo"
+    my_table["nniF"] = "ozzuoC"
+    my_table["Finn"] = "Limerick"     # Replaces the value in place
+    print(my_table["Finn"], my_table["nniF"], len(my_table))
+
+    del my_table["Pat"]
+    print("Pat" in my_table, my_table["Pat"])   # False None
+
+    for i in range(100):
+        my_table[f"key{i}"] = i
+    print(len(my_table.hashes), my_table["key42"])
+    print(my_table.stats())
@@ -0,0 +1,301 @@
+"""
+Implements a Skip List ordered map
+A skip list is a sorted linked list with extra express lanes. Every node is on level 0, and
+each node is also on the next level up with probability P, so level i skips over about
+1 / P^i nodes at a time. A search starts on the highest level and drops down a level
+whenever the next node would overshoot the key.
+
+Each node only stores as many forward pointers as it has levels, and next to each pointer
+the span, the number of level 0 nodes it skips over. Adding up the spans along a search
+gives the rank of a key, the number of keys smaller than it.
+
+add/get/pop:    O(log n) expected time
+rank/key_at:    O(log n) expected time
+range:          O(log n + k) expected time for k results
+from_sorted:    O(n) time
+Space:          O(n) expected
+"""
+import random
+from dataclasses import dataclass, field
+from typing import TypeVar
+from hash_table import MISSING
+
+K = TypeVar('K')
+T = TypeVar('T')
+MAX_LEVEL: int = 32
+P: float = 0.25
+
+
+@dataclass(slots=True)
+class SkipNode[K, T]:
+    """
+    A node holding a key and value and, for each of its levels, the next node
+    on that level and how many level 0 nodes away it is
+    """
+    key: K
+    val: T
+    next: list['SkipNode'] = field(default_factory=list)
+    span: list[int] = field(default_factory=list)
+
+
+class SkipList[K, T]:
+    """
+    The SkipList class that maps comparable keys to any value val in sorted key order
+    It has the same add/get/pop/__getitem__/__setitem__/__contains__ interface as HashTable
+    The span of a pointer to None is the number of nodes left after the node it starts from
+    """
+    def __init__(self, seed: int = None) -> None:
+        self.random = random.Random(seed)
+        self.head: SkipNode = SkipNode(None, None, [None] * MAX_LEVEL, [0] * MAX_LEVEL)
+        self.level: int = 1     # The number of levels in use
+        self.count: int = 0
+
+    @classmethod
+    def from_sorted(cls, items, seed: int = None) -> 'SkipList':
+        """
+        Builds a skip list from key and value pairs with strictly increasing keys in O(n) time
+        The levels are assigned by position instead of at random, so the node at position p
+        is on one extra level for each time 4 divides p and the lanes are perfectly even
+        """
+        skip_list: SkipList = cls(seed)
+        head: SkipNode = skip_list.head
+        last: list[SkipNode] = [head] * MAX_LEVEL
+        last_position: list[int] = [0] * MAX_LEVEL
+
+        position: int = 0
+        for key, val in items:
+            if position and not last[0].key < key:
+                raise ValueError("Keys must be strictly increasing")
+            position += 1
+            level: int = min(MAX_LEVEL, ((position & -position).bit_length() + 1) // 2)
+            node: SkipNode = SkipNode(key, val, [None] * level, [0] * level)
+            for i in range(level):
+                last[i].next[i] = node
+                last[i].span[i] = position - last_position[i]
+                last[i] = node
+                last_position[i] = position
+            skip_list.level = max(skip_list.level, level)
+
+        for i in range(MAX_LEVEL):
+            last[i].span[i] = position - last_position[i]
+        skip_list.count = position
+        return skip_list
+
+    def __len__(self) -> int:
+        return self.count
+
+    def random_level(self) -> int:
+        """
+        The number of levels for a new node, each extra level has probability P
+        """
+        level: int = 1
+        while level < MAX_LEVEL and self.random.random() < P:
+            level += 1
+        return level
+
+    def find_predecessors(self, key: K) -> tuple[list[SkipNode], list[int]]:
+        """
+        Returns the last node before the key on every level and the rank of each of those nodes
+        """
+        update: list[SkipNode] = [self.head] * MAX_LEVEL
+        ranks: list[int] = [0] * MAX_LEVEL
+        node: SkipNode = self.head
+        rank: int = 0
+        for i in reversed(range(self.level)):
+            while node.next[i] is not None and node.next[i].key < key:
+                rank += node.span[i]
+                node = node.next[i]
+            update[i] = node
+            ranks[i] = rank
+        return update, ranks
+
+    def find(self, key: K) -> SkipNode:
+        """
+        Returns the node holding the key or None if it is not in the skip list
+        """
+        node: SkipNode = self.head
+        for i in reversed(range(self.level)):
+            while node.next[i] is not None and node.next[i].key < key:
+                node = node.next[i]
+        node = node.next[0]
+        return node if node is not None and node.key == key else None
+
+    def add(self, key: K, val: T) -> None:
+        """
+        Add a value into the skip list given the key, replacing the value if the key exists
+        """
+        update, ranks = self.find_predecessors(key)
+        node: SkipNode = update[0].next[0]
+        if node is not None and node.key == key:
+            node.val = val
+            return
+
+        level: int = self.random_level()
+        if level > self.level:
+            # The new levels only have the head on them, which spans the whole list
+            for i in range(self.level, level):
+                self.head.span[i] = self.count
+            self.level = level
+
+        node = SkipNode(key, val, [None] * level, [0] * level)
+        for i in range(level):
+            prev: SkipNode = update[i]
+            node.next[i] = prev.next[i]
+            prev.next[i] = node
+            # prev is ranks[0] - ranks[i] nodes before the new node's predecessor on level 0
+            node.span[i] = prev.span[i] - (ranks[0] - ranks[i])
+            prev.span[i] = ranks[0] - ranks[i] + 1
+        for i in range(level, self.level):
+            update[i].span[i] += 1
+        self.count += 1
+
+    def __setitem__(self, key: K, val: T) -> None:
+        self.add(key, val)
+
+    def get(self, key: K) -> T:
+        """
+        Return a value from the skip list given the key
+        """
+        node: SkipNode = self.find(key)
+        return node.val if node is not None else None
+
+    def __getitem__(self, key: K) -> T:
+        return self.get(key)
+
+    def __contains__(self, key: K) -> bool:
+        return self.find(key) is not None
+
+    def pop(self, key: K, default=MISSING) -> T:
+        """
+        Removes the key and returns its value
+        If the key does not exist, default is returned or a KeyError is raised if there is no default
+        """
+        update, _ = self.find_predecessors(key)
+        node: SkipNode = update[0].next[0]
+        if node is None or node.key != key:
+            if default is MISSING:
+                raise KeyError(key)
+            return default
+
+        for i in range(self.level):
+            if update[i].next[i] is node:
+                update[i].span[i] += node.span[i] - 1
+                update[i].next[i] = node.next[i]
+            else:
+                update[i].span[i] -= 1
+        # Drop levels that no longer have any nodes on them
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.count -= 1
+        return node.val
+
+    def __delitem__(self, key: K) -> None:
+        self.pop(key)
+
+    def rank(self, key: K) -> int:
+        """
+        The number of keys in the skip list smaller than key
+        """
+        _, ranks = self.find_predecessors(key)
+        return ranks[0]
+
+    def key_at(self, index: int) -> tuple[K, T]:
+        """
+        Returns the key and value pair with the given rank, the index-th smallest key
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("skip list index out of range")
+
+        node: SkipNode = self.head
+        traversed: int = 0
+        for i in reversed(range(self.level)):
+            while node.next[i] is not None and traversed + node.span[i] <= index + 1:
+                traversed += node.span[i]
+                node = node.next[i]
+        return node.key, node.val
+
+    def floor(self, key: K) -> tuple[K, T]:
+        """
+        Returns the key and value pair with the largest key <= key, or None if there is none
+        """
+        node: SkipNode = self.head
+        for i in reversed(range(self.level)):
+            while node.next[i] is not None and node.next[i].key <= key:
+                node = node.next[i]
+        return (node.key, node.val) if node is not self.head else None
+
+    def ceiling(self, key: K) -> tuple[K, T]:
+        """
+        Returns the key and value pair with the smallest key >= key, or None if there is none
+        """
+        update, _ = self.find_predecessors(key)
+        node: SkipNode = update[0].next[0]
+        return (node.key, node.val) if node is not None else None
+
+    def range(self, lo: K = None, hi: K = None):
+        """
+        Yields the key and value pairs with lo <= key < hi in order
+        A bound of None leaves that end of the range open
+        """
+        if lo is None:
+            node: SkipNode = self.head.next[0]
+        else:
+            update, _ = self.find_predecessors(lo)
+            node = update[0].next[0]
+        while node is not None and (hi is None or node.key < hi):
+            yield node.key, node.val
+            node = node.next[0]
+
+    def items(self):
+        """
+        Yields every key and value pair in key order
+        """
+        return self.range()
+
+    def keys(self):
+        """
+        Yields every key in order
+        """
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        """
+        Yields every value in key order
+        """
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self):
+        return self.keys()
+
+    def print(self) -> None:
+        """
+        Prints every level of the skip list from the top down
+        """
+        for i in reversed(range(self.level)):
+            keys: list = []
+            node: SkipNode = self.head.next[i]
+            while node is not None:
+                keys.append(node.key)
+                node = node.next[i]
+            print(f"Level {i}: {keys}")
+
+
+if __name__ == "__main__":
+    my_list = SkipList(seed=0)
+    for timestamp in [50, 10, 40, 20, 30, 60]:
+        my_list[timestamp] = f"event{timestamp}"
+    my_list.print()
+    print()
+
+    print(list(my_list.range(20, 50)))   # [(20, 'event20'), (30, 'event30'), (40, 'event40')]
+    print(my_list.floor(35), my_list.ceiling(35))     # (30, 'event30') (40, 'event40')
+    print(my_list.rank(35), my_list.key_at(3))    # 3 (40, 'event40')
+    print(my_list.pop(30), 30 in my_list, len(my_list))     # event30 False 5
+
+    # Building from sorted input skips the searches and random levels
+    loaded = SkipList.from_sorted((i, i * i) for i in range(1000))
+    print(loaded[42], loaded.level, loaded.rank(500))    # 1764 5 500
@@ -1,29 +1,35 @@
 """
-Implements a LIFO Stack data structure using a Singly Linked List
+Implements a LIFO Stack data structure using a Singly Linked List,
+an ArrayStack that stores its values in contiguous chunks
+and an immutable PersistentStack
 """
+from array import array
+from dataclasses import dataclass
 from typing import TypeVar
-from linked_list import Node, SLL
+from linked_list import Node, NodePool, SLL
 
 T = TypeVar('T')
+CHUNK_SIZE: int = 1024
 
 class Stack[T]:
     """
     The Stack class
     All values are added and removed from the head of the queue
     """
-    def __init__(self):
-        self.sll = SLL(None)
+    def __init__(self, pool: NodePool = None):
+        # Popped nodes are recycled through the pool if one is given
+        self.sll = SLL(None, pool)
 
     def push(self, val: T) -> None:
         """
         Add a value to the top of the stack
         """
         if self.sll.head:
-            new_head: Node = Node(val)
+            new_head: Node = self.sll.new_node(val)
             new_head.next = self.sll.head
             self.sll.head = new_head
         else:
-            self.sll.head = Node(val)
+            self.sll.head = self.sll.new_node(val)
             self.sll.tail = self.sll.head
 
     def pop(self) -> T:
@@ -31,13 +37,164 @@ class Stack[T]:
         Removes a value from the top of the stack
         If the stack is empty it returns None
         """
-        if not self.sll.head:
-            return None
-        old_head: Node = self.sll.head
-        new_head: Node = self.sll.head.next
-        self.sll.head = new_head
+        return self.sll.pop_head()
 
-        return old_head.val
+class ArrayStack[T]:
+    """
+    The ArrayStack class
+    Values are stored in fixed size chunks so a push never allocates a node, and growing
+    adds one chunk instead of copying the whole stack. Every chunk but the last is full.
+    If a typecode is given the chunks are typed arrays, which store numbers compactly.
+
+    push/pop:   O(1) amortized time
+    Space:      O(n)
+    """
+    def __init__(self, typecode: str = None, chunk_size: int = CHUNK_SIZE) -> None:
+        self.typecode: str = typecode
+        self.chunk_size: int = chunk_size
+        self.chunks: list = [self.new_chunk()]
+        self.count: int = 0
+
+    def new_chunk(self):
+        """
+        Returns an empty chunk
+        """
+        return array(self.typecode) if self.typecode else []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(self, val: T) -> None:
+        """
+        Add a value to the top of the stack
+        """
+        chunk = self.chunks[-1]
+        if len(chunk) == self.chunk_size:
+            chunk = self.new_chunk()
+            self.chunks.append(chunk)
+        chunk.append(val)
+        self.count += 1
+
+    def push_many(self, vals) -> None:
+        """
+        Add every value to the top of the stack in order, so the last value ends up on top
+        """
+        vals = list(vals)
+        start: int = 0
+        while start < len(vals):
+            chunk = self.chunks[-1]
+            if len(chunk) == self.chunk_size:
+                chunk = self.new_chunk()
+                self.chunks.append(chunk)
+            end: int = min(len(vals), start + self.chunk_size - len(chunk))
+            chunk.extend(vals[start:end])
+            start = end
+        self.count += len(vals)
+
+    def pop(self) -> T:
+        """
+        Removes a value from the top of the stack
+        If the stack is empty it returns None
+        """
+        chunk = self.chunks[-1]
+        if not chunk:
+            if len(self.chunks) == 1:
+                return None
+            # The empty chunk is only dropped here so pushing and popping across
+            # a chunk boundary doesn't keep allocating a new chunk
+            self.chunks.pop()
+            chunk = self.chunks[-1]
+        self.count -= 1
+        return chunk.pop()
+
+    def pop_many(self, k: int) -> list[T]:
+        """
+        Removes up to k values from the top of the stack and returns them in the order they were popped
+        """
+        vals: list[T] = []
+        k = max(0, min(k, self.count))
+        while len(vals) < k:
+            chunk = self.chunks[-1]
+            if not chunk:
+                self.chunks.pop()
+                chunk = self.chunks[-1]
+            take: int = min(k - len(vals), len(chunk))
+            vals.extend(reversed(chunk[len(chunk) - take:]))
+            del chunk[len(chunk) - take:]
+        self.count -= k
+        return vals
+
+    def peek(self) -> T:
+        """
+        Returns the value at the top of the stack without removing it, or None if it is empty
+        """
+        if self.chunks[-1]:
+            return self.chunks[-1][-1]
+        return self.chunks[-2][-1] if len(self.chunks) > 1 else None
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Cons[T]:
+    """
+    An immutable cell holding a value and the rest of the stack below it
+    Cells compare by identity, so two versions are equal when they share the same cells
+    """
+    val: T
+    next: 'Cons' = None
+
+@dataclass(frozen=True, slots=True)
+class PersistentStack[T]:
+    """
+    The PersistentStack class
+    A stack that is never changed in place. push and pop return a new version that shares
+    every cell below the top with the old one, so keeping an old version around is an O(1)
+    snapshot, and versions can be shared between threads without locks.
+
+    push/pop/peek:  O(1) time
+    Space:          O(1) per push
+    """
+    head: Cons = None
+    count: int = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(self, val: T) -> 'PersistentStack':
+        """
+        Returns a new version of the stack with val on top
+        """
+        return PersistentStack(Cons(val, self.head), self.count + 1)
+
+    def pop(self) -> 'PersistentStack':
+        """
+        Returns a new version of the stack without its top value
+        Popping an empty stack returns the empty stack
+        """
+        if self.head is None:
+            return self
+        return PersistentStack(self.head.next, self.count - 1)
+
+    def peek(self) -> T:
+        """
+        Returns the value on top of the stack, or None if it is empty
+        """
+        return self.head.val if self.head is not None else None
+
+    def __iter__(self):
+        """
+        Yields every value from the top of the stack down
+        """
+        cell: Cons = self.head
+        while cell is not None:
+            yield cell.val
+            cell = cell.next
+
+    def to_list(self) -> list[T]:
+        """
+        Returns the values from the bottom of the stack up, in the order they were pushed
+        """
+        vals: list[T] = list(self)
+        vals.reverse()
+        return vals
 
 if __name__ == "__main__":
     mystack = Stack()
@@ -50,3 +207,15 @@ if __name__ == "__main__":
     print(mystack.pop())    # Pat
     print(mystack.pop())    # Liam
     print(mystack.pop())    # None
+
+    numbers = ArrayStack("q", chunk_size=4)
+    numbers.push_many(range(10))
+    print(len(numbers), numbers.peek(), numbers.pop_many(3))   # 10 9 [9, 8, 7]
+    print(numbers.pop(), len(numbers.chunks))      # 6 2
+
+    # Every version stays valid after later pushes and pops
+    empty = PersistentStack()
+    names = empty.push("Liam").push("Pat")
+    more_names = names.push("Mike")
+    print(names.to_list(), more_names.to_list(), more_names.pop() == names)     # ['Liam', 'Pat'] ['Liam', 'Pat', 'Mike'] True
+    print(len(empty), empty.peek(), more_names.peek())     # 0 None Mike
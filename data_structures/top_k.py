@@ -0,0 +1,128 @@
+"""
+Implements a bounded Top-K collector on top of the heaps in heap.py
+To keep the K largest items of a stream, a MinHeap of size K is used. Its root is the
+smallest of the K largest items seen so far, so any new item that is not larger than
+the root can be rejected with a single comparison. Only items that beat the root
+replace it and cost a sift_down.
+
+add:        O(log K) time, O(1) for a rejected item
+results:    O(K log K) time
+Space:      O(K) no matter how long the stream is
+"""
+from heap import DaryMinHeap, DaryMaxHeap, MinPriorityHeap, MaxPriorityHeap
+
+
+class TopK:
+    """
+    The TopK class
+    Keeps the k largest items (or the k smallest if largest is False) of everything added
+    The kept items are the same as sorted(items, key=key, reverse=largest)[:k], as with heapq,
+    so of items with equal keys the ones added first are kept.
+
+    With a key function the heap holds (key, order, item) tuples, where order is the position
+    the item was added in, so the key is only computed once per item and ties never compare
+    the items themselves. The key can be anything comparable.
+    If every key is a number a typecode such as "d" or "q" can be given instead, and the keys
+    are stored in a MinPriorityHeap or MaxPriorityHeap's priority array. Items with equal keys
+    are then kept in no particular order.
+    """
+    def __init__(self, k: int, largest: bool = True, key=None, typecode: str = None) -> None:
+        if k < 0:
+            raise ValueError("k must not be negative")
+        self.k: int = k
+        self.largest: bool = largest
+        self.key = key
+        self.typecode: str = typecode
+        self.decorated: bool = typecode is None and key is not None
+        self.num_added: int = 0
+
+        # The heap is ordered the opposite way so the root is the first item to evict
+        if typecode is not None:
+            self.heap = MinPriorityHeap(key, typecode) if largest else MaxPriorityHeap(key, typecode)
+        else:
+            self.heap = DaryMinHeap() if largest else DaryMaxHeap()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def add(self, item) -> None:
+        """
+        Offers an item to the collector
+        While there are fewer than k items it is always kept, otherwise it
+        replaces the root only if it beats it
+        """
+        if self.decorated:
+            # A later item sorts after an earlier one with the same key, so it never evicts it
+            order: int = -self.num_added if self.largest else self.num_added
+            item = (self.key(item), order, item)
+        self.num_added += 1
+
+        if len(self.heap) < self.k:
+            self.heap.add(item)
+        elif self.k:
+            self.heap.pushpop(item)
+
+    def push_many(self, iterable) -> None:
+        """
+        Offers every item in the iterable to the collector
+        """
+        for item in iterable:
+            self.add(item)
+
+    def merge(self, other: 'TopK') -> None:
+        """
+        Combines the partial result of another collector, such as one from another worker,
+        into this one. The other collector's items count as added after this one's, in the
+        order they were added to it.
+        """
+        self.push_many(other.results())
+
+    def results(self) -> list:
+        """
+        Returns the kept items with the best item first
+        """
+        if self.decorated:
+            return [entry[2] for entry in sorted(self.heap.items, reverse=self.largest)]
+        return sorted(self.heap.items, key=self.key, reverse=self.largest)
+
+
+def nlargest(k: int, iterable, key=None) -> list:
+    """
+    Returns the k largest items of the iterable, largest first, like heapq.nlargest
+    """
+    top_k: TopK = TopK(k, True, key)
+    top_k.push_many(iterable)
+    return top_k.results()
+
+
+def nsmallest(k: int, iterable, key=None) -> list:
+    """
+    Returns the k smallest items of the iterable, smallest first, like heapq.nsmallest
+    """
+    bottom_k: TopK = TopK(k, False, key)
+    bottom_k.push_many(iterable)
+    return bottom_k.results()
+
+
+if __name__ == "__main__":
+    stream: list[int] = [5, 2, -1, 7, 7, 0, 11, 3, 9, -4]
+
+    print(nlargest(3, stream))      # [11, 9, 7]
+    print(nsmallest(3, stream))     # [-4, -1, 0]
+
+    words: list[str] = ["pear", "fig", "banana", "kiwi", "apple"]
+    print(nlargest(2, words, key=len))     # ['banana', 'apple']
+    print(nlargest(2, ["b", "A", "c"], key=str.lower))    # ['c', 'b']
+
+    # Numeric keys can be kept in a typed priority array instead
+    lengths: TopK = TopK(2, key=len, typecode="q")
+    lengths.push_many(words)
+    print(lengths.results())    # ['banana', 'apple']
+
+    # Two workers each collect a partial top 3 which are then merged
+    worker1: TopK = TopK(3)
+    worker1.push_many(stream[:5])
+    worker2: TopK = TopK(3)
+    worker2.push_many(stream[5:])
+    worker1.merge(worker2)
+    print(worker1.results())        # [11, 9, 7]
@@ -0,0 +1,236 @@
+"""
+Implements an Unrolled Doubly Linked List
+Each Block node holds a list of up to block_size values instead of a single value, so a long
+sequence needs block_size times fewer node objects and iterating it mostly walks a flat list.
+
+Inserting into a full block splits it into two half full blocks. Removing from a block that
+drops below half full merges it with the next block, or takes values from it if they don't fit
+together, so every block except the last stays at least half full.
+
+get/set by index:   O(n / B) time
+insert/pop:         O(n / B + B) time
+Space:              O(n)
+"""
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+T = TypeVar('T')
+BLOCK_SIZE: int = 64
+
+
+@dataclass(slots=True)
+class Block[T]:
+    """
+    A node that holds up to block_size values and the next and previous Blocks
+    """
+    vals: list[T] = field(default_factory=list)
+    next: 'Block' = None
+    prev: 'Block' = None
+
+
+class UnrolledDLL[T]:
+    """
+    The UnrolledDLL class
+    It supports indexing, insertion and deletion at any position with the same
+    semantics as a list, and iterates in both directions
+    """
+    def __init__(self, vals=(), block_size: int = BLOCK_SIZE) -> None:
+        if block_size < 2:
+            raise ValueError("block_size must be at least 2")
+        self.block_size: int = block_size
+        self.head: Block = None     # The first block in the list
+        self.tail: Block = None     # The last block in the list
+        self.count: int = 0
+        self.num_blocks: int = 0
+        self.extend(vals)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def locate(self, index: int) -> tuple[Block, int]:
+        """
+        Returns the block holding the value at index and the value's offset in that block
+        The walk starts from whichever end of the list is closer
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("list index out of range")
+
+        if index < self.count // 2:
+            block: Block = self.head
+            while index >= len(block.vals):
+                index -= len(block.vals)
+                block = block.next
+            return block, index
+
+        index = self.count - index     # Count back from the end
+        block = self.tail
+        while index > len(block.vals):
+            index -= len(block.vals)
+            block = block.prev
+        return block, len(block.vals) - index
+
+    def __getitem__(self, index: int) -> T:
+        block, offset = self.locate(index)
+        return block.vals[offset]
+
+    def __setitem__(self, index: int, val: T) -> None:
+        block, offset = self.locate(index)
+        block.vals[offset] = val
+
+    def add_block_after(self, block: Block, new_block: Block) -> None:
+        """
+        Links new_block in after block, or as the only block if block is None
+        """
+        if block is None:
+            self.head = new_block
+            self.tail = new_block
+        else:
+            new_block.prev = block
+            new_block.next = block.next
+            if block.next:
+                block.next.prev = new_block
+            else:
+                self.tail = new_block
+            block.next = new_block
+        self.num_blocks += 1
+
+    def unlink_block(self, block: Block) -> None:
+        """
+        Removes a block from the list of blocks
+        """
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self.head = block.next
+        if block.next:
+            block.next.prev = block.prev
+        else:
+            self.tail = block.prev
+        self.num_blocks -= 1
+
+    def append(self, val: T) -> None:
+        """
+        Adds a value to the end of the list
+        """
+        if self.tail is None or len(self.tail.vals) == self.block_size:
+            self.add_block_after(self.tail, Block())
+        self.tail.vals.append(val)
+        self.count += 1
+
+    def extend(self, vals) -> None:
+        """
+        Adds every value to the end of the list, filling whole blocks at a time
+        """
+        vals = list(vals)
+        start: int = 0
+        if self.tail is not None:
+            start = self.block_size - len(self.tail.vals)
+            self.tail.vals.extend(vals[:start])
+        for block_start in range(start, len(vals), self.block_size):
+            self.add_block_after(self.tail, Block(vals[block_start:block_start + self.block_size]))
+        self.count += len(vals)
+
+    def insert(self, index: int, val: T) -> None:
+        """
+        Inserts a value before index, splitting the block if it is full
+        """
+        if index < 0:
+            index = max(0, index + self.count)
+        if index >= self.count:
+            self.append(val)
+            return
+
+        block, offset = self.locate(index)
+        block.vals.insert(offset, val)
+        self.count += 1
+        if len(block.vals) > self.block_size:
+            # Move the back half into a new block after this one
+            half: int = len(block.vals) // 2
+            self.add_block_after(block, Block(block.vals[half:]))
+            del block.vals[half:]
+
+    def pop(self, index: int = -1) -> T:
+        """
+        Removes and returns the value at index, the last value by default
+        """
+        if not self.count:
+            raise IndexError("pop from empty list")
+        block, offset = self.locate(index)
+        val: T = block.vals.pop(offset)
+        self.count -= 1
+        self.rebalance(block)
+        return val
+
+    def rebalance(self, block: Block) -> None:
+        """
+        Keeps a block that lost a value at least half full
+        """
+        if not block.vals:
+            self.unlink_block(block)
+            return
+        next_block: Block = block.next
+        if next_block is None or len(block.vals) >= self.block_size // 2:
+            return
+
+        if len(block.vals) + len(next_block.vals) <= self.block_size:
+            # Merge the next block into this one
+            block.vals.extend(next_block.vals)
+            self.unlink_block(next_block)
+        else:
+            # Take values from the front of the next block until both are about even
+            num_moved: int = (len(next_block.vals) - len(block.vals)) // 2
+            block.vals.extend(next_block.vals[:num_moved])
+            del next_block.vals[:num_moved]
+
+    def remove(self, val: T) -> None:
+        """
+        Removes the first occurrence of val, raising a ValueError if it is not in the list
+        """
+        block: Block = self.head
+        while block:
+            if val in block.vals:
+                block.vals.remove(val)
+                self.count -= 1
+                self.rebalance(block)
+                return
+            block = block.next
+        raise ValueError(f"{val} is not in list")
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    def __iter__(self):
+        block: Block = self.head
+        while block:
+            yield from block.vals
+            block = block.next
+
+    def __reversed__(self):
+        block: Block = self.tail
+        while block:
+            yield from reversed(block.vals)
+            block = block.prev
+
+    def print(self) -> None:
+        """
+        Prints the whole list from head to end, one block per line
+        """
+        block: Block = self.head
+        while block:
+            print(block.vals)
+            block = block.next
+
+
+if __name__ == "__main__":
+    unrolled = UnrolledDLL(range(10), block_size=4)
+    unrolled.print()    # [0, 1, 2, 3] [4, 5, 6, 7] [8, 9]
+    print()
+
+    unrolled.insert(2, 100)     # Splits the first block
+    unrolled.pop(5)
+    unrolled.remove(8)
+    unrolled.print()
+    print(unrolled[2], unrolled[-1], len(unrolled), unrolled.num_blocks)     # 100 9 9 4
+    print(list(reversed(unrolled)))